@@ -4,12 +4,6 @@ Example: Basic Paper Trading
 
 This example demonstrates a basic paper trading setup with the AI Trading System.
 """
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 from src.trading_system import TradingSystem
 
 
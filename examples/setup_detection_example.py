@@ -5,15 +5,10 @@ Example: Single Setup Detection
 This example demonstrates how to use individual components
 to detect and validate a single setup.
 """
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 from src.market_monitor import MarketMonitor
 from src.rule_engine import RuleEngine
 from src.ai_decision import AIDecisionEngine
+from src.common.models import AIDecision
 
 
 def main():
@@ -58,21 +53,21 @@ def main():
     current_price = market_monitor.get_latest_price()
     print(f"Current Price: ${current_price:.2f}")
     
-    for i, setup in enumerate(setups, 1):
+    # Get AI decisions with SL/TP (validated concurrently)
+    ai_decisions = ai_engine.validate_setups(setups, market_data, current_price)
+    
+    for i, (setup, ai_decision) in enumerate(zip(setups, ai_decisions), 1):
         print(f"\n  Setup {i}:")
         print(f"    Pattern: {setup.pattern_type}")
         print(f"    Symbol: {setup.symbol}")
         print(f"    Timeframes: {', '.join(str(tf) for tf in setup.timeframes)}")
         
-        # Get AI decision with SL/TP
-        ai_decision = ai_engine.validate_setup(setup, market_data, current_price)
-        
         print(f"    AI Decision: {ai_decision.decision}")
         print(f"    Confidence: {ai_decision.confidence}")
         print(f"    Reason: {ai_decision.reason_code}")
         
         # Show AI-defined trade parameters for TRADE decisions
-        if ai_decision.decision.value == "TRADE":
+        if ai_decision.decision == AIDecision.TRADE:
             print(f"\n    📊 AI-Defined Trade Parameters:")
             print(f"      Entry Price: ${ai_decision.entry_price or current_price:.2f}")
             print(f"      Stop Loss: ${ai_decision.stop_loss:.2f}")
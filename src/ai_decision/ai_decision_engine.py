@@ -8,10 +8,21 @@ This component is responsible for:
 - AI cannot: trade, invent prices, set positions/SL/TP
 - Purely advisory role
 """
-import json
-from typing import Dict
+import asyncio
+import atexit
+import hashlib
+import logging
+import math
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Dict, Final, List, Optional, Tuple
+import httpx
+import numpy as np
+import orjson
 import structlog
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient
 
 from src.common.models import (
     SetupEvent, 
@@ -19,132 +30,133 @@ from src.common.models import (
     AIDecisionOutput, 
     AIDecision, 
     AIConfidence,
-    NextCheck,
-    NextCheckType
 )
+from src.ai_decision.rate_limiter import AsyncRateLimiter
+from src.ai_decision.semantic_cache import SemanticDecisionCache
 from src.config import config
 
 logger = structlog.get_logger(__name__)
 
+# Connection pool for LLM HTTP clients: keep-alive connections are reused so
+# only the first call pays the TCP/TLS handshake
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=40,
+    keepalive_expiry=30.0,
+)
 
-class AIDecisionEngine:
-    """
-    AI Decision Engine for setup validation.
-    
-    Uses LLM to validate trading setups detected by the Rule Engine.
+# HTTP clients shared by every AIDecisionEngine in the process. Async pools
+# are bound to the event loop they run on, so there is one per loop.
+_shared_http_client: Optional[httpx.Client] = None
+_shared_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_http_client() -> httpx.Client:
+    """Return the process-wide pooled sync HTTP client."""
+    global _shared_http_client
+    with _shared_clients_lock:
+        if _shared_http_client is None or _shared_http_client.is_closed:
+            _shared_http_client = DefaultHttpxClient(limits=HTTP_LIMITS)
+        return _shared_http_client
+
+
+@atexit.register
+def _close_shared_http_client():
+    """Close whichever shared sync HTTP client is current at exit."""
+    if _shared_http_client is not None:
+        _shared_http_client.close()
+
+
+def _get_shared_async_http_client(loop: asyncio.AbstractEventLoop) -> httpx.AsyncClient:
+    """Return the pooled async HTTP client shared by all engines on loop."""
+    with _shared_clients_lock:
+        client = _shared_async_http_clients.get(loop)
+        if client is None or client.is_closed:
+            client = DefaultAsyncHttpxClient(limits=HTTP_LIMITS)
+            _shared_async_http_clients[loop] = client
+        return client
+
+# orjson options for prompt/cache serialization (numpy arrays serialize natively)
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+# Maximum number of parsed LLM decisions kept in the in-memory response cache
+RESPONSE_CACHE_SIZE = 4096
+
+# Seconds a cached LLM decision stays valid
+RESPONSE_CACHE_TTL = 24 * 60 * 60
+
+# Setup fields that differ per detection but do not change the AI input's meaning
+CACHE_IGNORED_SETUP_FIELDS = ("event_id", "timestamp")
+
+def _strict_json_schema(node):
     """
+    Make a Pydantic JSON schema acceptable for OpenAI strict structured outputs.
     
-    def __init__(self):
-        """Initialize AI Decision Engine."""
-        self.client = OpenAI(api_key=config.llm.api_key)
-        self.model = config.llm.model
-        self.temperature = config.llm.temperature
-        
-        logger.info(
-            "AI Decision Engine initialized",
-            model=self.model,
-            temperature=self.temperature
-        )
+    Every object forbids extra keys and lists all properties as required
+    (optional fields stay nullable via anyOf). Defaults and descriptions are
+    dropped; the descriptions are internal docstrings, not model guidance.
     
-    def validate_setup(self, setup: SetupEvent, market_data: Dict[str, MarketData], current_price: float) -> AIDecisionOutput:
-        """
-        Validate a trading setup using AI.
+    Args:
+        node: Schema node (dict, list or scalar)
         
-        Args:
-            setup: SetupEvent to validate
-            market_data: Market data for context
-            current_price: Current market price
-            
-        Returns:
-            AIDecisionOutput with validation result
-        """
-        logger.info(
-            "Validating setup with AI",
-            event_id=setup.event_id,
-            pattern_type=setup.pattern_type,
-            current_price=current_price
-        )
-        
-        try:
-            # Prepare input for AI
-            ai_input = self._prepare_ai_input(setup, market_data, current_price)
-            
-            # Get AI decision
-            response = self._call_llm(ai_input)
-            
-            # Parse response
-            decision = self._parse_ai_response(response)
-            
-            logger.info(
-                "AI validation complete",
-                event_id=setup.event_id,
-                decision=decision.decision,
-                confidence=decision.confidence,
-                reason_code=decision.reason_code,
-                entry_price=decision.entry_price,
-                stop_loss=decision.stop_loss,
-                take_profit=decision.take_profit
-            )
-            
-            return decision
-            
-        except Exception as e:
-            logger.error(
-                "Error during AI validation",
-                event_id=setup.event_id,
-                error=str(e)
-            )
-            # Return safe default: NO_TRADE
-            return AIDecisionOutput(
-                decision=AIDecision.NO_TRADE,
-                confidence=AIConfidence.LOW,
-                reason_code="AI_ERROR"
-            )
-    
-    def _prepare_ai_input(self, setup: SetupEvent, market_data: Dict[str, MarketData], current_price: float) -> dict:
-        """
-        Prepare input data for the AI.
-        
-        Args:
-            setup: SetupEvent to validate
-            market_data: Market data for context
-            current_price: Current market price
-            
-        Returns:
-            Dictionary with structured input for AI
-        """
-        # Extract relevant OHLCV data
-        ohlcv_data = {}
-        for timeframe_str, data in market_data.items():
-            # Get last 20 candles for context
-            recent_candles = data.ohlcv[-20:] if len(data.ohlcv) > 20 else data.ohlcv
-            ohlcv_data[timeframe_str] = recent_candles
-        
-        return {
-            "setup": {
-                "event_id": setup.event_id,
-                "symbol": setup.symbol,
-                "pattern_type": setup.pattern_type,
-                "timestamp": setup.timestamp.isoformat(),
-                "context_data": setup.context_data,
-            },
-            "current_price": current_price,
-            "market_data": {
-                timeframe: candles for timeframe, candles in ohlcv_data.items()
-            }
-        }
+    Returns:
+        Strict copy of the node
+    """
+    if isinstance(node, list):
+        return [_strict_json_schema(item) for item in node]
+    if not isinstance(node, dict):
+        return node
     
-    def _call_llm(self, ai_input: dict) -> str:
-        """
-        Call the LLM with prepared input.
-        
-        Args:
-            ai_input: Prepared input dictionary
-            
-        Returns:
-            LLM response as string
-        """
-        system_prompt = """You are a professional trading setup validator with deep expertise in risk management.
+    strict = {
+        key: _strict_json_schema(value)
+        for key, value in node.items()
+        if key not in ("default", "description")
+    }
+    if "properties" in strict:
+        strict["additionalProperties"] = False
+        strict["required"] = list(strict["properties"])
+    return strict
+
+
+# Structured output: with strict=True the API enforces the AIDecisionOutput
+# schema (including enum values) server-side
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "ai_decision",
+        "strict": True,
+        "schema": _strict_json_schema(AIDecisionOutput.model_json_schema()),
+    },
+}
+
+# OpenAI Batch API: terminal batch states and default polling interval (seconds)
+BATCH_TERMINAL_STATES = ("completed", "failed", "expired", "cancelled")
+BATCH_POLL_INTERVAL = 30.0
+
+# Rough token estimate for rate limiting (no tokenizer dependency): prompt
+# characters per token, plus an allowance for the short JSON reply
+CHARS_PER_TOKEN = 4
+COMPLETION_TOKEN_ESTIMATE = 200
+
+# Fail-closed defaults; AIDecisionOutput is frozen so these are shared
+AI_ERROR_DECISION = AIDecisionOutput(
+    decision=AIDecision.NO_TRADE,
+    confidence=AIConfidence.LOW,
+    reason_code="AI_ERROR"
+)
+PARSE_ERROR_DECISION = AIDecisionOutput(
+    decision=AIDecision.NO_TRADE,
+    confidence=AIConfidence.LOW,
+    reason_code="PARSE_ERROR"
+)
+
+# System prompt is identical for every call, so the message is built once. It
+# must stay free of per-request content: providers cache identical prompt
+# prefixes (OpenAI from 1024 tokens), which discounts these input tokens.
+SYSTEM_PROMPT: Final[str] = """You are a professional trading setup validator with deep expertise in risk management.
 
 Your role is to:
 1. Validate the quality of detected trading setups
@@ -177,6 +189,24 @@ Think in R-multiples, not percentages or money:
 
 📌 RULE: Survive bad streaks - profits come automatically
 
+INPUT FORMAT:
+Each request contains, in this order:
+- Setup Information: the detected setup as JSON
+  - pattern_type: "breakout_retest" | "support_bounce" | "resistance_rejection"
+  - context_data.direction_bias: "long" or "short" as implied by the pattern
+  - context_data.level: the key level (support/resistance, zone_low/zone_high, touches, tolerance)
+  - context_data.volatility: atr_14 and atr_pct of the pattern timeframe
+  - context_data.breakout / retest (breakout_retest) or signal_bar (bounce/rejection): the bars that triggered the setup
+  - context_data.quality: a deterministic 0-10 triage score with its inputs - a hint, not a decision
+- Market Data Summary: symbol, current price and available timeframes
+- Recent Price Action: the last 20 candles per timeframe (see PRICE DATA ENCODING)
+- Indicators: SMA20 and RSI14 per timeframe, last 20 values oldest first; null means not enough history yet
+
+PRICE DATA ENCODING:
+Candles are given per timeframe as {"base": B, "tick": T, "vol_tick": V, "candles": [[o, h, l, c, v], ...]}, oldest first.
+Prices are integer tick offsets from the base: price = B + value * T. Volume is an integer multiple of V: volume = v * V.
+Always answer with real prices, never with encoded values.
+
 RESPONSE FORMAT - You MUST respond with valid JSON:
 {
   "decision": "TRADE" | "NO_TRADE" | "WAIT",
@@ -225,17 +255,24 @@ Focus on:
 - Realistic risk/reward ratio
 - Market phase (trending vs ranging)"""
 
-        user_prompt = f"""Validate this trading setup:
+SYSTEM_MESSAGE: Final[dict] = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Static skeleton of the per-setup user message; only the fields are filled in per call
+USER_PROMPT_TEMPLATE: Final[str] = """Validate this trading setup:
 
 Setup Information:
-{json.dumps(ai_input['setup'], indent=2)}
+{setup}
 
 Market Data Summary:
-Symbol: {ai_input['setup']['symbol']}
-Current Price: {ai_input.get('current_price', 'N/A')}
-Timeframes Available: {', '.join(ai_input['market_data'].keys())}
+Symbol: {symbol}
+Current Price: {current_price}
+Timeframes Available: {timeframes}
+
+Recent Price Action (last 20 candles per timeframe, tick-encoded):
+{market_data}
 
-Recent Price Action (OHLCV - last 20 candles per timeframe available in data)
+Indicators per timeframe (SMA20 / RSI14, last 20 values, oldest first):
+{indicators}
 
 Analyze the setup considering:
 1. Is this pattern at a logical market level?
@@ -245,23 +282,842 @@ Analyze the setup considering:
 
 Respond ONLY with the JSON decision object. No explanations or additional text."""
 
+
+class AIDecisionEngine:
+    """
+    AI Decision Engine for setup validation.
+    
+    Uses LLM to validate trading setups detected by the Rule Engine.
+    """
+    
+    def __init__(self, log_level: int = logging.INFO):
+        """
+        Initialize AI Decision Engine.
+        
+        Args:
+            log_level: Level for per-setup log records; pass logging.WARNING
+                (or higher) in backtests to skip the per-call info chatter
+        """
+        self.client = OpenAI(
+            api_key=config.llm.api_key,
+            timeout=config.llm.timeout,
+            max_retries=config.llm.max_retries,
+            http_client=_get_shared_http_client()
+        )
+        # Created on first use, on the event loop it will run on
+        self.async_client: Optional[AsyncOpenAI] = None
+        self.model = config.llm.model
+        self.temperature = config.llm.temperature
+        self.max_concurrency = config.llm.max_concurrency
+        self._verbose = log_level <= logging.INFO
+        
+        # Dedicated event loop for the sync batch wrapper, so the async
+        # client's connection pool always stays bound to the same loop
+        self._loop = None
+        
+        # Loop the async client's pooled connections belong to
+        self._client_loop = None
+        
+        # Parsed LLM decisions keyed by a content hash of the AI input: (expires_at, decision)
+        self._response_cache: "OrderedDict[bytes, Tuple[float, AIDecisionOutput]]" = OrderedDict()
+        self._clock = time.monotonic
+        
+        # Lookups answered from the caches vs. sent to the LLM, for the dedupe ratio
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Optional similarity cache for near-identical setups
+        threshold = config.llm.semantic_cache_threshold
+        self._semantic_cache = SemanticDecisionCache(threshold) if threshold > 0 else None
+        
+        # Optional RPM/TPM pacing of async calls
+        rpm, tpm = config.llm.max_requests_per_minute, config.llm.max_tokens_per_minute
+        self._rate_limiter = AsyncRateLimiter(rpm, tpm) if rpm > 0 or tpm > 0 else None
+        
+        # Last serialized candle window per timeframe: (fingerprint, candles)
+        self._window_cache: Dict[str, Tuple[Tuple[int, bytes], dict]] = {}
+        
+        logger.info(
+            "AI Decision Engine initialized",
+            model=self.model,
+            temperature=self.temperature,
+            max_concurrency=self.max_concurrency
+        )
+    
+    @staticmethod
+    def _create_async_client() -> AsyncOpenAI:
+        """
+        Create an async OpenAI client on the running loop's shared pool.
+        
+        Returns:
+            AsyncOpenAI client
+        """
+        return AsyncOpenAI(
+            api_key=config.llm.api_key,
+            timeout=config.llm.timeout,
+            max_retries=config.llm.max_retries,
+            http_client=_get_shared_async_http_client(asyncio.get_running_loop())
+        )
+    
+    def _bind_async_client(self):
+        """
+        Make sure the async client's pool belongs to the running event loop.
+        
+        Pooled connections cannot be shared across event loops, so a client
+        on that loop's shared pool is used when batches move to another loop.
+        """
+        loop = asyncio.get_running_loop()
+        stale = self._client_loop is not None and self._client_loop is not loop
+        if self.async_client is None or stale or getattr(self.async_client, "is_closed", lambda: False)():
+            self.async_client = self._create_async_client()
+        self._client_loop = loop
+    
+    def close(self):
+        """
+        Close the private batch event loop and its connection pool.
+        
+        The shared sync pool stays open for other engines and is closed at
+        interpreter exit. Use aclose() for pools on loops you own.
+        """
+        if self._loop is not None and not self._loop.is_closed():
+            pool = _shared_async_http_clients.pop(self._loop, None)
+            if pool is not None:
+                self._loop.run_until_complete(pool.aclose())
+            self._loop.close()
+        self._loop = None
+        self._client_loop = None
+        self.async_client = None
+    
+    async def aclose(self):
+        """
+        Close the shared connection pool of the running event loop.
+        
+        Call once at shutdown of a loop that ran validate_setups_async; the
+        pool is shared by every engine on that loop.
+        """
+        pool = _shared_async_http_clients.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.aclose()
+        self._client_loop = None
+        self.async_client = None
+    
+    def validate_setup(self, setup: SetupEvent, market_data: Dict[str, MarketData], current_price: float) -> AIDecisionOutput:
+        """
+        Validate a trading setup using AI.
+        
+        Args:
+            setup: SetupEvent to validate
+            market_data: Market data for context
+            current_price: Current market price
+            
+        Returns:
+            AIDecisionOutput with validation result
+        """
+        if self._verbose:
+            logger.info(
+                "Validating setup with AI",
+                event_id=setup.event_id,
+                pattern_type=setup.pattern_type,
+                current_price=current_price
+            )
+        
+        try:
+            # Prepare input for AI
+            ai_input = self._prepare_ai_input(setup, market_data, current_price)
+            
+            # Identical inputs are answered from the response cache
+            key = self._cache_key(ai_input)
+            decision = self._lookup_decision(key, ai_input)
+            if decision is None:
+                # Get AI decision
+                response = self._call_llm(ai_input)
+                
+                # Parse response
+                decision = self._parse_ai_response(response)
+                self._store_cached_decision(key, decision, ai_input)
+            
+            if self._verbose:
+                logger.info(
+                    "AI validation complete",
+                    event_id=setup.event_id,
+                    decision=decision.decision,
+                    confidence=decision.confidence,
+                    reason_code=decision.reason_code,
+                    entry_price=decision.entry_price,
+                    stop_loss=decision.stop_loss,
+                    take_profit=decision.take_profit
+                )
+            
+            return decision
+            
+        except Exception as e:
+            logger.error(
+                "Error during AI validation",
+                event_id=setup.event_id,
+                error=str(e)
+            )
+            # Return safe default: NO_TRADE
+            return AI_ERROR_DECISION
+    
+    def validate_setups(
+        self,
+        setups: List[SetupEvent],
+        market_data: Dict[str, MarketData],
+        current_price: float
+    ) -> List[AIDecisionOutput]:
+        """
+        Validate multiple trading setups concurrently.
+        
+        Synchronous wrapper around validate_setups_async. Do not call this
+        from inside a running event loop - await validate_setups_async instead.
+        
+        Args:
+            setups: SetupEvents to validate
+            market_data: Market data for context
+            current_price: Current market price
+            
+        Returns:
+            List of AIDecisionOutput in the same order as setups
+        """
+        if not setups:
+            return []
+        
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        
+        return self._loop.run_until_complete(
+            self.validate_setups_async(setups, market_data, current_price)
+        )
+    
+    def validate_setups_batch_api(
+        self,
+        setups: List[SetupEvent],
+        market_data: Dict[str, MarketData],
+        current_price: float,
+        poll_interval: float = BATCH_POLL_INTERVAL
+    ) -> List[AIDecisionOutput]:
+        """
+        Validate many setups through the OpenAI Batch API.
+        
+        For offline runs that can wait: requests are uploaded as one JSONL
+        file and processed within the 24h completion window at a lower
+        token price and from a separate rate-limit pool. Blocks until the
+        batch finishes. Cached inputs are answered locally and duplicates
+        are submitted once.
+        
+        Args:
+            setups: SetupEvents to validate
+            market_data: Market data for context
+            current_price: Current market price
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            List of AIDecisionOutput in the same order as setups
+        """
+        decisions: Dict[bytes, AIDecisionOutput] = {}
+        requests: Dict[bytes, dict] = {}
+        keys: List[Optional[bytes]] = []
+        for setup in setups:
+            try:
+                ai_input = self._prepare_ai_input(setup, market_data, current_price)
+                key = self._cache_key(ai_input)
+            except Exception as e:
+                self._log_validation_error(setup, e)
+                keys.append(None)
+                continue
+            
+            keys.append(key)
+            if key in decisions or key in requests:
+                continue
+            cached = self._lookup_decision(key, ai_input)
+            if cached is not None:
+                decisions[key] = cached
+            else:
+                requests[key] = ai_input
+        
+        if requests:
+            logger.info("Submitting setups to the Batch API", request_count=len(requests))
+            try:
+                responses = self._run_batch(requests, poll_interval)
+            except Exception as e:
+                logger.error("Batch API validation failed", error=str(e))
+                responses = {}
+            
+            for key, ai_input in requests.items():
+                if key not in responses:
+                    decisions[key] = AI_ERROR_DECISION
+                    continue
+                decision = self._parse_ai_response(responses[key])
+                self._store_cached_decision(key, decision, ai_input)
+                decisions[key] = decision
+        
+        return [decisions[key] if key is not None else AI_ERROR_DECISION for key in keys]
+    
+    def _run_batch(self, requests: Dict[bytes, dict], poll_interval: float) -> Dict[bytes, str]:
+        """
+        Upload, run and collect one Batch API job.
+        
+        Args:
+            requests: Prepared AI inputs keyed by cache key
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            Response content keyed by cache key (failed requests are missing)
+        """
+        lines = [
+            orjson.dumps({
+                "custom_id": key.hex(),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self._build_messages(ai_input),
+                    "temperature": self.temperature,
+                    "response_format": RESPONSE_FORMAT,
+                },
+            })
+            for key, ai_input in requests.items()
+        ]
+        input_file = self.client.files.create(
+            file=("ai_decisions.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        while batch.status not in BATCH_TERMINAL_STATES:
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.error("Batch did not complete", batch_id=batch.id, status=batch.status)
+            return {}
+        
+        responses: Dict[bytes, str] = {}
+        output = self.client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.error("Batch request failed", custom_id=record.get("custom_id"), error=record.get("error"))
+                continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            responses[bytes.fromhex(record["custom_id"])] = content
+        return responses
+    
+    async def validate_setups_async(
+        self,
+        setups: List[SetupEvent],
+        market_data: Dict[str, MarketData],
+        current_price: float
+    ) -> List[AIDecisionOutput]:
+        """
+        Validate multiple trading setups concurrently.
+        
+        LLM calls are latency-bound, so requests are fanned out in parallel
+        and capped at max_concurrency in-flight calls. Setups whose
+        normalized AI input is identical (see _normalize_ai_input) share a
+        single LLM call.
+        
+        Args:
+            setups: SetupEvents to validate
+            market_data: Market data for context
+            current_price: Current market price
+            
+        Returns:
+            List of AIDecisionOutput in the same order as setups
+        """
+        self._bind_async_client()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _validate(setup: SetupEvent, ai_input: Optional[dict], key: bytes) -> AIDecisionOutput:
+            if ai_input is None:
+                return AI_ERROR_DECISION
+            async with semaphore:
+                return await self._validate_input_async(setup, ai_input, key)
+        
+        # Group setups with the same normalized AI input (the response-cache
+        # key) so each group costs one LLM call
+        group_index: Dict[bytes, int] = {}
+        unique: List[Tuple[SetupEvent, Optional[dict], bytes]] = []
+        positions: List[int] = []
+        for index, setup in enumerate(setups):
+            try:
+                ai_input = self._prepare_ai_input(setup, market_data, current_price)
+                key = self._cache_key(ai_input)
+            except Exception as e:
+                self._log_validation_error(setup, e)
+                ai_input, key = None, b"error:%d" % index
+            
+            if key not in group_index:
+                group_index[key] = len(unique)
+                unique.append((setup, ai_input, key))
+            positions.append(group_index[key])
+        
+        logger.info(
+            "Validating setups with AI",
+            setup_count=len(setups),
+            unique_setups=len(unique)
+        )
+        
+        decisions = await asyncio.gather(*[_validate(*entry) for entry in unique])
+        
+        logger.info(
+            "AI decision cache stats",
+            cache_hits=self.cache_hits,
+            cache_misses=self.cache_misses,
+            hit_ratio=round(self.cache_hits / max(self.cache_hits + self.cache_misses, 1), 3)
+        )
+        
+        # Broadcast each group's decision (frozen, so sharing is safe)
+        return [decisions[position] for position in positions]
+    
+    async def validate_setup_async(
+        self,
+        setup: SetupEvent,
+        market_data: Dict[str, MarketData],
+        current_price: float
+    ) -> AIDecisionOutput:
+        """
+        Validate a trading setup using AI without blocking the event loop.
+        
+        Args:
+            setup: SetupEvent to validate
+            market_data: Market data for context
+            current_price: Current market price
+            
+        Returns:
+            AIDecisionOutput with validation result
+        """
+        self._bind_async_client()
+        try:
+            ai_input = self._prepare_ai_input(setup, market_data, current_price)
+            key = self._cache_key(ai_input)
+        except Exception as e:
+            self._log_validation_error(setup, e)
+            # Return safe default: NO_TRADE
+            return AI_ERROR_DECISION
+        
+        return await self._validate_input_async(setup, ai_input, key)
+    
+    async def _validate_input_async(self, setup: SetupEvent, ai_input: dict, key: bytes) -> AIDecisionOutput:
+        """
+        Validate a prepared AI input, answering from the response cache when possible.
+        
+        Args:
+            setup: SetupEvent being validated (for logging)
+            ai_input: Prepared input dictionary
+            key: Cache key of ai_input
+            
+        Returns:
+            AIDecisionOutput with validation result
+        """
+        try:
+            decision = self._lookup_decision(key, ai_input)
+            if decision is None:
+                response = await self._call_llm_async(ai_input)
+                decision = self._parse_ai_response(response)
+                self._store_cached_decision(key, decision, ai_input)
+            
+            if self._verbose:
+                logger.info(
+                    "AI validation complete",
+                    event_id=setup.event_id,
+                    decision=decision.decision,
+                    confidence=decision.confidence,
+                    reason_code=decision.reason_code
+                )
+            
+            return decision
+            
+        except Exception as e:
+            self._log_validation_error(setup, e)
+            # Return safe default: NO_TRADE
+            return AI_ERROR_DECISION
+    
+    @staticmethod
+    def _log_validation_error(setup: SetupEvent, error: Exception):
+        """
+        Log a failed setup validation.
+        
+        Args:
+            setup: SetupEvent that failed
+            error: Raised exception
+        """
+        logger.error(
+            "Error during AI validation",
+            event_id=setup.event_id,
+            error=str(error)
+        )
+    
+    def _prepare_ai_input(self, setup: SetupEvent, market_data: Dict[str, MarketData], current_price: float) -> dict:
+        """
+        Prepare input data for the AI.
+        
+        Args:
+            setup: SetupEvent to validate
+            market_data: Market data for context
+            current_price: Current market price
+            
+        Returns:
+            Dictionary with structured input for AI
+        """
+        # Extract relevant OHLCV data (tick-encoded)
+        ohlcv_data = {}
+        indicators = {}
+        for timeframe, data in market_data.items():
+            # Keys may be Timeframe members; the prompt needs plain strings
+            timeframe_str = str(getattr(timeframe, "value", timeframe))
+            
+            # Get last 20 candles for context (array view, no copy)
+            ohlcv_data[timeframe_str] = self._serialize_window(timeframe_str, data.ohlcv[-20:])
+            
+            # Precomputed indicators (computed once per fetch by the Market Monitor)
+            if data.sma20 is not None and data.rsi14 is not None:
+                indicators[timeframe_str] = {
+                    "sma_20": self._round_series(data.sma20[-20:]),
+                    "rsi_14": self._round_series(data.rsi14[-20:]),
+                }
+        
+        return {
+            "setup": {
+                "event_id": setup.event_id,
+                "symbol": setup.symbol,
+                "pattern_type": setup.pattern_type,
+                "timestamp": setup.timestamp.isoformat(),
+                "context_data": setup.context_data,
+            },
+            "current_price": current_price,
+            "market_data": {
+                timeframe: candles for timeframe, candles in ohlcv_data.items()
+            },
+            "indicators": indicators
+        }
+    
+    @staticmethod
+    def _round_series(values: np.ndarray) -> np.ndarray:
+        """
+        Round an indicator series for the prompt.
+        
+        NaN warm-up values are kept; orjson serializes them as null.
+        
+        Args:
+            values: Indicator values
+            
+        Returns:
+            Array of values rounded to two decimals
+        """
+        return np.round(values, 2)
+    
+    def _serialize_window(self, timeframe: str, window: np.ndarray) -> dict:
+        """
+        Tick-encode a candle window for the prompt, once per unique window.
+        
+        Prices are sent as integer tick offsets from the first candle's close,
+        which needs far fewer tokens than raw floats sharing the same leading
+        digits. Volume is sent as integer multiples of its own tick, so
+        fractional volumes keep five significant digits. Candles with
+        missing (non-finite) values are skipped. Consecutive validations
+        usually share the same window, so the last encoded window per
+        timeframe is reused while its newest candle is unchanged.
+        
+        Args:
+            timeframe: Timeframe key of the window
+            window: Candle array view, shape (N, 6)
+            
+        Returns:
+            Dictionary with base price, price/volume ticks and [o, h, l, c, v] candles
+        """
+        empty = {"base": None, "tick": None, "vol_tick": None, "candles": []}
+        if len(window) == 0:
+            return empty
+        
+        fingerprint = (len(window), window[-1].tobytes())
+        cached = self._window_cache.get(timeframe)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
+        window = window[np.isfinite(window[:, 1:6]).all(axis=1)]
+        if len(window) == 0:
+            encoded = empty
+        else:
+            base = float(window[0, 4])
+            tick = self._tick_size(base)
+            vol_tick = self._tick_size(float(np.abs(window[:, 5]).max()))
+            prices = np.rint((window[:, 1:5] - base) / tick).astype(np.int64)
+            volume = np.rint(window[:, 5] / vol_tick).astype(np.int64)
+            
+            encoded = {
+                "base": base,
+                "tick": tick,
+                "vol_tick": vol_tick,
+                "candles": np.column_stack((prices, volume)),
+            }
+        self._window_cache[timeframe] = (fingerprint, encoded)
+        return encoded
+    
+    @staticmethod
+    def _tick_size(price: float) -> float:
+        """
+        Choose an encoding tick that keeps five significant digits of price.
+        
+        Args:
+            price: Reference price
+            
+        Returns:
+            Tick size as a power of ten
+        """
+        if not price or not math.isfinite(price):
+            return 1.0
+        return 10.0 ** (math.floor(math.log10(abs(price))) - 4)
+    
+    def _build_messages(self, ai_input: dict) -> List[dict]:
+        """
+        Build the chat messages for an LLM call.
+        
+        Args:
+            ai_input: Prepared input dictionary
+            
+        Returns:
+            List of chat messages (system + user)
+        """
+        user_prompt = USER_PROMPT_TEMPLATE.format(
+            setup=self._dumps(ai_input['setup']),
+            symbol=ai_input['setup']['symbol'],
+            current_price=ai_input.get('current_price', 'N/A'),
+            timeframes=', '.join(ai_input['market_data'].keys()),
+            market_data=self._dumps(ai_input['market_data']),
+            indicators=self._dumps(ai_input.get('indicators', {}))
+        )
+
+        return [
+            SYSTEM_MESSAGE,
+            {"role": "user", "content": user_prompt}
+        ]
+    
+    @staticmethod
+    def _dumps(value) -> str:
+        """
+        Serialize a prompt fragment to compact JSON.
+        
+        Args:
+            value: JSON-compatible value (numpy arrays allowed)
+            
+        Returns:
+            JSON string
+        """
+        return orjson.dumps(value, option=JSON_OPTIONS, default=str).decode("utf-8")
+    
+    @classmethod
+    def _normalize_ai_input(cls, ai_input: dict) -> dict:
+        """
+        Reduce an AI input to the parts that determine the LLM's answer.
+        
+        Per-detection identifiers (event_id, detection timestamp) are
+        dropped and the current price is rounded to the encoding tick, so
+        re-detections of the same setup on the same candles compare equal.
+        
+        Args:
+            ai_input: Prepared input dictionary
+            
+        Returns:
+            Normalized copy of ai_input
+        """
+        setup = {
+            k: v for k, v in ai_input["setup"].items()
+            if k not in CACHE_IGNORED_SETUP_FIELDS
+        }
+        current_price = ai_input.get("current_price")
+        if isinstance(current_price, (int, float)) and math.isfinite(current_price):
+            tick = cls._tick_size(current_price)
+            current_price = (int(round(current_price / tick)), tick)
+        return {**ai_input, "setup": setup, "current_price": current_price}
+    
+    @classmethod
+    def _cache_key(cls, ai_input: dict) -> bytes:
+        """
+        Compute a stable content hash for an AI input.
+        
+        Args:
+            ai_input: Prepared input dictionary
+            
+        Returns:
+            16-byte digest of the canonical JSON form of the normalized ai_input
+        """
+        normalized = cls._normalize_ai_input(ai_input)
+        canonical = orjson.dumps(normalized, option=JSON_OPTIONS | orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+    
+    def _lookup_decision(self, key: bytes, ai_input: dict) -> Optional[AIDecisionOutput]:
+        """
+        Look up a decision in the exact cache, then the semantic cache.
+        
+        Args:
+            key: Cache key from _cache_key
+            ai_input: Prepared input dictionary
+            
+        Returns:
+            Cached decision or None if the LLM has to be called
+        """
+        decision = self._get_cached_decision(key) or self._get_similar_decision(ai_input)
+        if decision is None:
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+        return decision
+    
+    def _get_cached_decision(self, key: bytes) -> Optional[AIDecisionOutput]:
+        """
+        Look up a cached LLM decision.
+        
+        Args:
+            key: Cache key from _cache_key
+            
+        Returns:
+            Cached decision or None on a miss or expired entry
+        """
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, decision = entry
+        if expires_at <= self._clock():
+            del self._response_cache[key]
+            return None
+        
+        self._response_cache.move_to_end(key)
+        logger.debug("LLM response cache hit")
+        return decision
+    
+    def _get_similar_decision(self, ai_input: dict) -> Optional[AIDecisionOutput]:
+        """
+        Look up a decision for a near-identical input in the semantic cache.
+        
+        Args:
+            ai_input: Prepared input dictionary
+            
+        Returns:
+            Cached decision or None (also when the semantic cache is disabled)
+        """
+        if self._semantic_cache is None:
+            return None
+        return self._semantic_cache.lookup(ai_input)
+    
+    def _store_cached_decision(self, key: bytes, decision: AIDecisionOutput, ai_input: Optional[dict] = None):
+        """
+        Store a parsed LLM decision, evicting the least recently used entry when full.
+        
+        Parse failures are not cached, so a malformed reply is retried on
+        the next identical input instead of being replayed.
+        
+        Args:
+            key: Cache key from _cache_key
+            decision: Parsed decision to cache
+            ai_input: Prepared input, also indexed by the semantic cache if enabled
+        """
+        if decision is PARSE_ERROR_DECISION:
+            return
+        
+        if self._semantic_cache is not None and ai_input is not None:
+            self._semantic_cache.store(ai_input, decision)
+        
+        self._response_cache[key] = (self._clock() + RESPONSE_CACHE_TTL, decision)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+    
+    def _call_llm(self, ai_input: dict) -> str:
+        """
+        Call the LLM with prepared input.
+        
+        Args:
+            ai_input: Prepared input dictionary
+            
+        Returns:
+            LLM response as string
+        """
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+                messages=self._build_messages(ai_input),
+                temperature=self.temperature,
+                response_format=RESPONSE_FORMAT
+            )
+            
+            self._log_usage(response)
+            return response.choices[0].message.content
+            
+        except Exception as e:
+            logger.error("Error calling LLM", error=str(e))
+            raise
+    
+    async def _call_llm_async(self, ai_input: dict) -> str:
+        """
+        Call the LLM with prepared input using the async client.
+        
+        Args:
+            ai_input: Prepared input dictionary
+            
+        Returns:
+            LLM response as string
+        """
+        try:
+            messages = self._build_messages(ai_input)
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(self._estimate_tokens(messages))
+            
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
                 temperature=self.temperature,
-                response_format={"type": "json_object"}
+                response_format=RESPONSE_FORMAT
             )
             
+            self._log_usage(response)
             return response.choices[0].message.content
             
         except Exception as e:
             logger.error("Error calling LLM", error=str(e))
             raise
     
+    @staticmethod
+    def _estimate_tokens(messages: List[dict]) -> int:
+        """
+        Estimate the tokens a call will use, for rate limiting.
+        
+        Args:
+            messages: Chat messages of the call
+            
+        Returns:
+            Estimated prompt + completion tokens
+        """
+        chars = sum(len(message["content"]) for message in messages)
+        return chars // CHARS_PER_TOKEN + COMPLETION_TOKEN_ESTIMATE
+    
+    @staticmethod
+    def _log_usage(response):
+        """
+        Log token usage, including prompt tokens served from the provider cache.
+        
+        Args:
+            response: Chat completion response
+        """
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        logger.debug(
+            "LLM token usage",
+            prompt_tokens=usage.prompt_tokens,
+            cached_prompt_tokens=getattr(details, "cached_tokens", None),
+            completion_tokens=usage.completion_tokens
+        )
+    
     def _parse_ai_response(self, response: str) -> AIDecisionOutput:
         """
         Parse AI response into AIDecisionOutput.
@@ -273,40 +1129,9 @@ Respond ONLY with the JSON decision object. No explanations or additional text."
             AIDecisionOutput object
         """
         try:
-            data = json.loads(response)
-            
-            # Extract next_check if present
-            next_check = None
-            if "next_check" in data and data["next_check"]:
-                next_check = NextCheck(
-                    type=NextCheckType(data["next_check"]["type"]),
-                    value=data["next_check"]["value"]
-                )
-            
-            # Extract trade parameters if present (for TRADE decisions)
-            entry_price = data.get("entry_price")
-            stop_loss = data.get("stop_loss")
-            take_profit = data.get("take_profit")
-            side = data.get("side")
-            
-            decision = AIDecisionOutput(
-                decision=AIDecision(data["decision"]),
-                confidence=AIConfidence(data["confidence"]),
-                reason_code=data["reason_code"],
-                next_check=next_check,
-                entry_price=entry_price,
-                stop_loss=stop_loss,
-                take_profit=take_profit,
-                side=side
-            )
-            
-            return decision
+            return AIDecisionOutput.model_validate_json(response)
             
         except Exception as e:
             logger.error("Error parsing AI response", error=str(e), response=response)
             # Return safe default
-            return AIDecisionOutput(
-                decision=AIDecision.NO_TRADE,
-                confidence=AIConfidence.LOW,
-                reason_code="PARSE_ERROR"
-            )
+            return PARSE_ERROR_DECISION
@@ -0,0 +1,98 @@
+"""
+Async Rate Limiter - keep LLM fan-out under the provider's rate limits.
+
+Concurrent validation can fire requests faster than the account's
+requests-per-minute (RPM) and tokens-per-minute (TPM) limits allow; every
+429 then costs a backoff stall. Two token buckets, refilled continuously,
+let each call wait just long enough to stay under both limits instead.
+"""
+import asyncio
+import time
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class AsyncRateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute token buckets for asyncio code.
+    
+    Not bound to an event loop, so one limiter can be shared by every loop
+    an engine runs on. A limit of 0 disables that bucket.
+    """
+    
+    def __init__(self, max_requests_per_minute: int, max_tokens_per_minute: int):
+        """
+        Initialize Async Rate Limiter.
+        
+        Args:
+            max_requests_per_minute: Request budget per minute (0 = unlimited)
+            max_tokens_per_minute: Token budget per minute (0 = unlimited)
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        
+        # Buckets start full, so a cold start may use one minute's budget at once
+        self._requests = float(max_requests_per_minute)
+        self._tokens = float(max_tokens_per_minute)
+        self._clock = time.monotonic
+        self._sleep = asyncio.sleep
+        self._updated = self._clock()
+    
+    async def acquire(self, tokens: int):
+        """
+        Wait until one request using the given number of tokens fits both budgets.
+        
+        Args:
+            tokens: Estimated tokens of the request (prompt + completion)
+        """
+        # A request larger than the whole bucket would never fit
+        if self.max_tokens_per_minute:
+            tokens = min(tokens, self.max_tokens_per_minute)
+        
+        while True:
+            self._refill()
+            wait = max(
+                self._wait_time(self._requests, 1, self.max_requests_per_minute),
+                self._wait_time(self._tokens, tokens, self.max_tokens_per_minute),
+            )
+            if wait <= 0:
+                break
+            logger.debug("Rate limit reached, waiting", wait_seconds=round(wait, 3))
+            await self._sleep(wait)
+        
+        # No await between the check and the deduction, so this is atomic
+        self._requests -= 1
+        self._tokens -= tokens
+    
+    def _refill(self):
+        """Add the budget accrued since the last refill, capped at one minute's worth."""
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(
+            self._requests + elapsed * self.max_requests_per_minute / 60.0,
+            float(self.max_requests_per_minute)
+        )
+        self._tokens = min(
+            self._tokens + elapsed * self.max_tokens_per_minute / 60.0,
+            float(self.max_tokens_per_minute)
+        )
+    
+    @staticmethod
+    def _wait_time(available: float, needed: float, per_minute: int) -> float:
+        """
+        Seconds until a bucket holds the needed amount.
+        
+        Args:
+            available: Current bucket level
+            needed: Amount to take
+            per_minute: Bucket refill rate per minute (0 = unlimited)
+        
+        Returns:
+            Seconds to wait, 0 if the amount is available now
+        """
+        if not per_minute or available >= needed:
+            return 0.0
+        return (needed - available) * 60.0 / per_minute
@@ -0,0 +1,181 @@
+"""
+Semantic Decision Cache - reuse decisions for near-identical setups.
+
+Consecutive cycles often produce setups whose candle windows, indicators
+and levels are almost identical to one that was already validated. Each
+prepared AI input is reduced to a small price-relative feature vector; a
+new input whose cosine similarity to a cached one exceeds the threshold,
+and whose vector length is close to the cached one, reuses that decision
+instead of calling the LLM.
+
+Only decisions without price levels (NO_TRADE / WAIT) are reused: a TRADE
+carries entry, stop-loss and take-profit prices that belong to the
+original setup.
+"""
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+import numpy as np
+import structlog
+
+from src.common.models import AIDecision, AIDecisionOutput
+
+logger = structlog.get_logger(__name__)
+
+# Candles per timeframe that go into the feature vector
+FEATURE_CANDLES = 20
+
+# Cosine similarity ignores scale: a window moving 0.1% and one moving 5%
+# can point the same way. Hits also need vector norms within this ratio.
+NORM_RATIO_MIN = 0.8
+
+# RSI band width; the last RSI of every timeframe must fall in the same band
+RSI_BAND = 5.0
+
+
+class SemanticDecisionCache:
+    """
+    Cosine-similarity cache of AI decisions, bucketed by setup shape.
+    
+    Vectors are only compared within a bucket of the same symbol, pattern,
+    timeframes, level keys and RSI bands, so every vector in a bucket has
+    the same dimension and the pattern type never has to be encoded
+    numerically.
+    """
+    
+    def __init__(self, threshold: float, max_entries: int = 1024):
+        """
+        Initialize Semantic Decision Cache.
+        
+        Args:
+            threshold: Minimum cosine similarity (0..1) for a hit
+            max_entries: Entries kept per bucket (oldest are dropped first)
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._buckets: Dict[tuple, Deque[Tuple[np.ndarray, float, AIDecisionOutput]]] = {}
+    
+    def lookup(self, ai_input: dict) -> Optional[AIDecisionOutput]:
+        """
+        Find a cached decision for a near-identical AI input.
+        
+        Args:
+            ai_input: Prepared input dictionary
+        
+        Returns:
+            Cached decision or None if nothing is similar enough
+        """
+        bucket_key, vector, norm = self._features(ai_input)
+        entries = self._buckets.get(bucket_key)
+        if vector is None or not entries:
+            return None
+        
+        matrix = np.stack([entry[0] for entry in entries])
+        norms = np.array([entry[1] for entry in entries])
+        scores = matrix @ vector
+        # Only entries with a similar move size are candidates
+        scores[np.minimum(norms, norm) < NORM_RATIO_MIN * np.maximum(norms, norm)] = -np.inf
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        
+        logger.debug("Semantic cache hit", similarity=float(scores[best]))
+        return entries[best][2]
+    
+    def store(self, ai_input: dict, decision: AIDecisionOutput):
+        """
+        Remember a decision for later near-identical inputs.
+        
+        Args:
+            ai_input: Prepared input dictionary
+            decision: Parsed LLM decision
+        """
+        if decision.decision == AIDecision.TRADE:
+            return
+        
+        bucket_key, vector, norm = self._features(ai_input)
+        if vector is None:
+            return
+        
+        entries = self._buckets.setdefault(bucket_key, deque(maxlen=self.max_entries))
+        entries.append((vector, norm, decision))
+    
+    @staticmethod
+    def _features(ai_input: dict) -> Tuple[tuple, Optional[np.ndarray], float]:
+        """
+        Build the bucket key, L2-normalized feature vector and its norm.
+        
+        Features are the last closes and SMA-20 values of every timeframe
+        and the price levels, all expressed as returns relative to the
+        current price. The last RSI-14 of every timeframe goes into the
+        bucket key as an RSI_BAND-wide band, since it is not a price.
+        
+        Args:
+            ai_input: Prepared input dictionary
+        
+        Returns:
+            (bucket key, unit vector, norm); the vector is None if none can be built
+        """
+        setup = ai_input["setup"]
+        current_price = ai_input.get("current_price")
+        level = (setup.get("context_data") or {}).get("level", {})
+        indicators = ai_input.get("indicators") or {}
+        
+        # Counts (e.g. touches) must match exactly; prices become features
+        price_keys = sorted(k for k, v in level.items() if isinstance(v, float))
+        exact_levels = tuple(sorted(
+            (k, v) for k, v in level.items() if isinstance(v, (int, str)) and not isinstance(v, bool)
+        ))
+        timeframes = tuple(sorted(ai_input["market_data"]))
+        rsi_bands = tuple(
+            (timeframe, SemanticDecisionCache._rsi_band(indicators[timeframe]["rsi_14"]))
+            for timeframe in sorted(indicators)
+        )
+        bucket_key = (
+            setup["symbol"], str(setup["pattern_type"]), timeframes, tuple(price_keys), exact_levels, rsi_bands
+        )
+        
+        if not current_price:
+            return bucket_key, None, 0.0
+        
+        parts = []
+        for timeframe in timeframes:
+            window = ai_input["market_data"][timeframe]
+            closes = np.zeros(FEATURE_CANDLES)
+            candles = window["candles"]
+            if len(candles):
+                encoded = np.asarray(candles, dtype=np.float64)[-FEATURE_CANDLES:, 3]
+                closes[FEATURE_CANDLES - len(encoded):] = (
+                    window["base"] + encoded * window["tick"]
+                ) / current_price - 1.0
+            parts.append(closes)
+        for timeframe in sorted(indicators):
+            sma = np.zeros(FEATURE_CANDLES)
+            values = np.asarray(indicators[timeframe]["sma_20"], dtype=np.float64)[-FEATURE_CANDLES:]
+            if len(values):
+                # NaN warm-up values count as "at the current price"
+                sma[FEATURE_CANDLES - len(values):] = np.nan_to_num(values / current_price - 1.0)
+            parts.append(sma)
+        parts.append(np.array([level[k] / current_price - 1.0 for k in price_keys]))
+        
+        vector = np.concatenate(parts) if parts else np.zeros(0)
+        norm = float(np.linalg.norm(vector))
+        if not np.isfinite(norm) or norm == 0.0:
+            return bucket_key, None, 0.0
+        return bucket_key, vector / norm, norm
+    
+    @staticmethod
+    def _rsi_band(rsi: np.ndarray) -> Optional[int]:
+        """
+        Band index of the last RSI value.
+        
+        Args:
+            rsi: RSI-14 series (may contain NaN warm-up values)
+        
+        Returns:
+            Band index, or None if the last value is missing
+        """
+        values = np.asarray(rsi, dtype=np.float64)
+        if not len(values) or not np.isfinite(values[-1]):
+            return None
+        return int(values[-1] // RSI_BAND)
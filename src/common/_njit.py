@@ -0,0 +1,31 @@
+"""
+Optional Numba JIT support.
+
+Numba is an optional dependency. When it is installed, ``njit`` compiles
+numeric hot loops to native code; otherwise it is a no-op decorator and
+the plain Python implementation runs unchanged.
+"""
+try:
+    from numba import njit as _numba_njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args, **kwargs):
+    """
+    Compile a function with ``numba.njit`` if available.
+    
+    Supports both ``@njit`` and ``@njit(cache=True, ...)`` forms.
+    """
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    
+    def decorator(func):
+        return func
+    
+    return decorator
@@ -0,0 +1,113 @@
+"""
+Streaming technical indicators.
+
+Each indicator is computed for a whole series in a single O(N) pass using
+its recurrence form, so callers compute it once per fetch and slice the
+result instead of recomputing a window per setup.
+"""
+import math
+
+import numpy as np
+
+from src.common._njit import njit
+
+
+@njit(cache=True)
+def sma_stream(close: np.ndarray, window: int) -> np.ndarray:
+    """
+    Simple moving average via V[t] = V[t-1] + (S[t] - S[t-w]) / w.
+    
+    A non-finite close restarts the running sum, so it only blanks the
+    windows that contain it (like a rolling mean) instead of the whole tail.
+    
+    Args:
+        close: Close prices, float64
+        window: Averaging window in bars
+        
+    Returns:
+        Array of len(close); the first window-1 values are NaN
+    """
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    out[:] = np.nan
+    if window <= 0:
+        return out
+    
+    total = 0.0
+    run = 0  # consecutive finite closes ending at t
+    for t in range(n):
+        value = close[t]
+        if not math.isfinite(value):
+            total = 0.0
+            run = 0
+            continue
+        
+        total += value
+        run += 1
+        if run > window:
+            total -= close[t - window]
+        if run >= window:
+            out[t] = total / window
+    
+    return out
+
+
+@njit(cache=True)
+def rsi_stream(close: np.ndarray, window: int) -> np.ndarray:
+    """
+    Relative Strength Index with Wilder smoothing.
+    
+    A non-finite close restarts the warm-up, so it only blanks the next
+    window values instead of the whole tail.
+    
+    Args:
+        close: Close prices, float64
+        window: RSI period in bars
+        
+    Returns:
+        Array of len(close); the first window values are NaN
+    """
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    out[:] = np.nan
+    if window <= 0:
+        return out
+    
+    prev = np.nan
+    changes = 0  # price changes seen since the last restart
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for t in range(n):
+        value = close[t]
+        if not math.isfinite(value):
+            prev = np.nan
+            changes = 0
+            avg_gain = 0.0
+            avg_loss = 0.0
+            continue
+        if not math.isfinite(prev):
+            prev = value
+            continue
+        
+        change = value - prev
+        prev = value
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        changes += 1
+        
+        if changes <= window:
+            # Warm-up: plain average of the first window changes
+            avg_gain += gain / window
+            avg_loss += loss / window
+            if changes < window:
+                continue
+        else:
+            avg_gain = (avg_gain * (window - 1) + gain) / window
+            avg_loss = (avg_loss * (window - 1) + loss) / window
+        
+        if avg_loss == 0.0:
+            out[t] = 100.0 if avg_gain > 0 else 50.0
+        else:
+            out[t] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    
+    return out
@@ -14,7 +14,10 @@ def setup_logging():
     log_file = Path(config.logging.log_file)
     log_file.parent.mkdir(parents=True, exist_ok=True)
     
-    # Configure structlog
+    level = getattr(logging, config.logging.level)
+    
+    # Configure structlog. The filtering wrapper drops calls below the
+    # configured level before any event dict is built or processed.
     structlog.configure(
         processors=[
             structlog.stdlib.filter_by_level,
@@ -27,6 +30,7 @@ def setup_logging():
             structlog.processors.JSONRenderer()
         ],
         context_class=dict,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
@@ -34,7 +38,7 @@ def setup_logging():
     # Configure standard logging
     logging.basicConfig(
         format="%(message)s",
-        level=getattr(logging, config.logging.level),
+        level=level,
         handlers=[
             logging.FileHandler(config.logging.log_file),
             logging.StreamHandler()
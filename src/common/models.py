@@ -3,7 +3,8 @@ Common data models for the trading system.
 """
 from typing import List, Dict, Any, Optional, Literal
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict
+import numpy as np
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 from enum import Enum
 
 
@@ -17,14 +18,25 @@ class Timeframe(str, Enum):
 
 class MarketData(BaseModel):
     """Market data output from Market Monitor"""
-    model_config = ConfigDict(
-        json_encoders={datetime: lambda v: v.isoformat()}
-    )
+    model_config = ConfigDict(arbitrary_types_allowed=True)
     
     symbol: str
     timeframe: Timeframe
     timestamp: datetime
-    ohlcv: List[List[float]]  # [[timestamp, open, high, low, close, volume], ...]
+    ohlcv: np.ndarray  # float64, shape (N, 6): [timestamp, open, high, low, close, volume]
+    
+    # Whether the last candle in ohlcv has closed (exchanges return the forming bar last)
+    is_closed: bool = True
+    
+    # Precomputed indicator series aligned with ohlcv (see src.common.indicators)
+    sma20: Optional[np.ndarray] = None
+    rsi14: Optional[np.ndarray] = None
+    
+    @field_validator("ohlcv", mode="before")
+    @classmethod
+    def _to_ohlcv_array(cls, value: Any) -> np.ndarray:
+        """Accept list-of-lists candles and store them as one contiguous array."""
+        return np.asarray(value, dtype=np.float64).reshape(-1, 6)
 
 
 class PatternType(str, Enum):
@@ -36,10 +48,6 @@ class PatternType(str, Enum):
 
 class SetupEvent(BaseModel):
     """Setup event from Rule Engine"""
-    model_config = ConfigDict(
-        json_encoders={datetime: lambda v: v.isoformat()}
-    )
-    
     event_id: str
     symbol: str
     pattern_type: PatternType
@@ -70,15 +78,15 @@ class NextCheckType(str, Enum):
 
 class NextCheck(BaseModel):
     """Next check specification for WAIT decisions"""
+    model_config = ConfigDict(frozen=True)
+    
     type: NextCheckType
     value: str  # e.g., "15m" for time, "close_above_level" for event
 
 
 class AIDecisionOutput(BaseModel):
-    """AI Decision Engine output"""
-    model_config = ConfigDict(
-        json_encoders={datetime: lambda v: v.isoformat()}
-    )
+    """AI Decision Engine output (immutable, safe to share between setups)"""
+    model_config = ConfigDict(frozen=True)
     
     decision: AIDecision
     confidence: AIConfidence
@@ -106,10 +114,6 @@ class OrderType(str, Enum):
 
 class TradeOrder(BaseModel):
     """Trade order to be executed"""
-    model_config = ConfigDict(
-        json_encoders={datetime: lambda v: v.isoformat()}
-    )
-    
     trade_id: str
     symbol: str
     side: OrderSide
@@ -131,10 +135,6 @@ class TradeStatus(str, Enum):
 
 class Trade(BaseModel):
     """Active trade"""
-    model_config = ConfigDict(
-        json_encoders={datetime: lambda v: v.isoformat()}
-    )
-    
     trade_id: str
     symbol: str
     side: OrderSide
@@ -23,6 +23,16 @@ class LLMConfig(BaseModel):
     api_key: str = Field(default_factory=lambda: os.getenv("OPENAI_API_KEY", ""))
     model: str = Field(default_factory=lambda: os.getenv("LLM_MODEL", "gpt-4"))
     temperature: float = Field(default_factory=lambda: float(os.getenv("LLM_TEMPERATURE", "0.1")))
+    max_concurrency: int = Field(default_factory=lambda: int(os.getenv("LLM_MAX_CONCURRENCY", "16")))
+    timeout: float = Field(default_factory=lambda: float(os.getenv("LLM_TIMEOUT", "60.0")))
+    max_retries: int = Field(default_factory=lambda: int(os.getenv("LLM_MAX_RETRIES", "3")))
+    # Cosine similarity above which a near-identical setup reuses a cached decision (0 = off)
+    semantic_cache_threshold: float = Field(
+        default_factory=lambda: float(os.getenv("LLM_SEMANTIC_CACHE_THRESHOLD", "0"))
+    )
+    # Provider rate limits the async fan-out is paced to (0 = unlimited)
+    max_requests_per_minute: int = Field(default_factory=lambda: int(os.getenv("LLM_MAX_REQUESTS_PER_MINUTE", "0")))
+    max_tokens_per_minute: int = Field(default_factory=lambda: int(os.getenv("LLM_MAX_TOKENS_PER_MINUTE", "0")))
 
 
 class TradingConfig(BaseModel):
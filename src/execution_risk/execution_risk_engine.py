@@ -48,6 +48,18 @@ class ExecutionRiskEngine:
         self.consecutive_losses = 0
         self.in_cooldown = False
         
+        # Risk rules are fixed for the engine's lifetime, so read them from
+        # config once instead of on every check
+        self._max_trades_per_day = config.risk.max_trades_per_day
+        self._max_risk_per_day = config.risk.max_risk_per_day
+        # Keyed by AIConfidence member, so a missing level fails here, not mid-trade
+        self._risk_by_confidence = {
+            confidence: config.risk.risk_mapping[confidence.value]
+            for confidence in AIConfidence
+        }
+        self._cooldown_after_losses = config.risk.cooldown_after_losses
+        self._paper_trading = config.exchange.paper_trading
+        
         logger.info(
             "Execution & Risk Engine initialized",
             account_balance=account_balance
@@ -68,22 +80,22 @@ class ExecutionRiskEngine:
             logger.info("Trade rejected: AI decision is not TRADE", decision=ai_decision.decision)
             return False
         
+        # Check cooldown
+        if self.in_cooldown:
+            logger.warning("Trade rejected: In cooldown period")
+            return False
+        
         # Check daily trade limit
-        if self.daily_trades >= config.risk.max_trades_per_day:
+        if self.daily_trades >= self._max_trades_per_day:
             logger.warning("Trade rejected: Daily trade limit reached")
             return False
         
-        # Check daily risk limit
-        risk_for_trade = config.risk.risk_mapping[ai_decision.confidence.value]
-        if self.daily_risk_used + risk_for_trade > config.risk.max_risk_per_day:
+        # Check daily risk limit (the only check that needs a lookup, so last)
+        risk_for_trade = self._risk_by_confidence[ai_decision.confidence]
+        if self.daily_risk_used + risk_for_trade > self._max_risk_per_day:
             logger.warning("Trade rejected: Daily risk limit would be exceeded")
             return False
         
-        # Check cooldown
-        if self.in_cooldown:
-            logger.warning("Trade rejected: In cooldown period")
-            return False
-        
         return True
     
     def validate_ai_trade_parameters(
@@ -145,7 +157,7 @@ class ExecutionRiskEngine:
             if rr_ratio < 1.0:  # Minimum 1:1 risk/reward
                 return False, f"Risk/reward ratio too low: {rr_ratio:.2f} (min 1:1)"
             
-            logger.info(
+            logger.debug(
                 "AI trade parameters validated",
                 entry_price=entry_price,
                 stop_loss=stop_loss,
@@ -185,7 +197,7 @@ class ExecutionRiskEngine:
             raise ValueError(f"Invalid AI trade parameters: {error_msg}")
         
         # Calculate risk amount based on AI confidence
-        risk_r = config.risk.risk_mapping[ai_decision.confidence.value]
+        risk_r = self._risk_by_confidence[ai_decision.confidence]
         risk_amount = self.account_balance * (risk_r / 100)
         
         # Use AI-provided values
@@ -198,8 +210,9 @@ class ExecutionRiskEngine:
         risk_per_unit = abs(entry_price - stop_loss)
         quantity = risk_amount / risk_per_unit
         
-        # Create order
-        order = TradeOrder(
+        # Create order (values were computed and validated above, so skip
+        # pydantic validation)
+        order = TradeOrder.model_construct(
             trade_id=str(uuid.uuid4()),
             symbol=setup.symbol,
             side=side,
@@ -246,7 +259,7 @@ class ExecutionRiskEngine:
         
         # In paper trading mode, we simulate execution at market price
         # In live mode, use exchange API to place order
-        if config.exchange.paper_trading:
+        if self._paper_trading:
             logger.info("Executing order in PAPER TRADING mode", trade_id=order.trade_id)
             entry_price = order.price if order.price else order.stop_loss * 1.02  # Simulate entry
         else:
@@ -254,8 +267,8 @@ class ExecutionRiskEngine:
             # TODO: Implement actual order placement via exchange API
             entry_price = order.price if order.price else order.stop_loss * 1.02
         
-        # Create trade record
-        trade = Trade(
+        # Create trade record from the already validated order
+        trade = Trade.model_construct(
             trade_id=order.trade_id,
             symbol=order.symbol,
             side=order.side,
@@ -309,7 +322,7 @@ class ExecutionRiskEngine:
             self.consecutive_losses = 0
         
         # Check if cooldown needed
-        if self.consecutive_losses >= config.risk.cooldown_after_losses:
+        if self.consecutive_losses >= self._cooldown_after_losses:
             self.in_cooldown = True
             logger.warning(
                 "Cooldown activated",
@@ -6,17 +6,36 @@ This component is responsible for:
 - Managing multiple fixed timeframes
 - No logic, no decisions - pure data provider
 """
+import threading
+import time
 import ccxt
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import structlog
 
+from src.common.indicators import rsi_stream, sma_stream
 from src.common.models import MarketData, Timeframe
 from src.config import config
 
 logger = structlog.get_logger(__name__)
 
+# Column labels of the cached candle arrays, built once for every DataFrame view
+OHLCV_COLUMNS = pd.Index(['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+
+# Candle duration per timeframe in milliseconds (ccxt timestamps are epoch ms)
+TIMEFRAME_MS: Dict[str, int] = {
+    "1m": 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 60 * 60_000,
+    "4h": 4 * 60 * 60_000,
+    "1d": 24 * 60 * 60_000,
+}
+
 
 class MarketMonitor:
     """
@@ -37,8 +56,40 @@ class MarketMonitor:
         self.timeframes = timeframes or config.trading.timeframes
         
         # Initialize exchange
+        self.exchange = self._create_exchange()
+        
+        if config.exchange.paper_trading:
+            logger.info("Market Monitor initialized in PAPER TRADING mode")
+        
+        # Timeframes are fetched concurrently by a long-lived pool. ccxt
+        # instances (and their rate-limit throttle) are not thread-safe, so
+        # each worker thread gets its own exchange instance.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(len(self.timeframes), 1),
+            thread_name_prefix="market-monitor"
+        )
+        self._local = threading.local()
+        
+        # In-memory cache of the last fetched candle array per timeframe,
+        # extended incrementally; DataFrames are only built on request
+        self.cache: Dict[str, np.ndarray] = {}
+        
+        logger.info(
+            "Market Monitor initialized",
+            symbol=self.symbol,
+            timeframes=self.timeframes,
+            exchange=config.exchange.name
+        )
+    
+    def _create_exchange(self):
+        """
+        Create a configured ccxt exchange instance.
+        
+        Returns:
+            ccxt exchange
+        """
         exchange_class = getattr(ccxt, config.exchange.name)
-        self.exchange = exchange_class({
+        exchange = exchange_class({
             'apiKey': config.exchange.api_key,
             'secret': config.exchange.api_secret,
             'enableRateLimit': True,
@@ -48,18 +99,21 @@ class MarketMonitor:
         })
         
         if config.exchange.paper_trading:
-            self.exchange.set_sandbox_mode(True)
-            logger.info("Market Monitor initialized in PAPER TRADING mode")
+            exchange.set_sandbox_mode(True)
         
-        # In-memory cache for recent candles
-        self.cache: Dict[str, pd.DataFrame] = {}
+        return exchange
+    
+    def _worker_exchange(self):
+        """
+        Get the exchange instance owned by the current worker thread.
         
-        logger.info(
-            "Market Monitor initialized",
-            symbol=self.symbol,
-            timeframes=self.timeframes,
-            exchange=config.exchange.name
-        )
+        Returns:
+            ccxt exchange, created on first use in each thread
+        """
+        exchange = getattr(self._local, "exchange", None)
+        if exchange is None:
+            exchange = self._local.exchange = self._create_exchange()
+        return exchange
     
     def fetch_ohlcv(self, timeframe: str, limit: int = 100) -> MarketData:
         """
@@ -69,6 +123,20 @@ class MarketMonitor:
             timeframe: Timeframe to fetch (e.g., "1d", "4h", "15m")
             limit: Number of candles to fetch
             
+        Returns:
+            MarketData object with OHLCV data
+        """
+        return self._fetch_ohlcv(self.exchange, timeframe, limit)
+    
+    def _fetch_ohlcv(self, exchange, timeframe: str, limit: int) -> MarketData:
+        """
+        Fetch OHLCV data for a specific timeframe using the given exchange.
+        
+        Args:
+            exchange: ccxt exchange instance used by the calling thread
+            timeframe: Timeframe to fetch
+            limit: Number of candles to fetch
+            
         Returns:
             MarketData object with OHLCV data
         """
@@ -80,27 +148,23 @@ class MarketMonitor:
                 limit=limit
             )
             
-            # Fetch from exchange
-            ohlcv = self.exchange.fetch_ohlcv(
-                symbol=self.symbol,
-                timeframe=timeframe,
-                limit=limit
-            )
-            
-            # Update cache
-            self.cache[timeframe] = pd.DataFrame(
-                ohlcv,
-                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            )
+            ohlcv = self._fetch_candles(exchange, timeframe, limit)
+            self.cache[timeframe] = ohlcv
             
             # Create MarketData object
             market_data = MarketData(
                 symbol=self.symbol,
                 timeframe=Timeframe(timeframe),
                 timestamp=datetime.now(),
-                ohlcv=ohlcv
+                ohlcv=ohlcv,
+                is_closed=self._is_last_bar_closed(ohlcv, timeframe)
             )
             
+            # Compute indicators once per fetch so every consumer can reuse them
+            close = np.ascontiguousarray(market_data.ohlcv[:, 4])
+            market_data.sma20 = sma_stream(close, 20)
+            market_data.rsi14 = rsi_stream(close, 14)
+            
             logger.debug(
                 "OHLCV data fetched successfully",
                 symbol=self.symbol,
@@ -119,6 +183,71 @@ class MarketMonitor:
             )
             raise
     
+    @staticmethod
+    def _is_last_bar_closed(ohlcv: np.ndarray, timeframe: str) -> bool:
+        """
+        Check whether the newest candle has closed.
+        
+        Args:
+            ohlcv: Candle array, shape (N, 6), timestamps in epoch ms
+            timeframe: Timeframe of the candles
+            
+        Returns:
+            True if the last candle's period has ended (or there are no candles)
+        """
+        if not len(ohlcv):
+            return True
+        
+        try:
+            duration = TIMEFRAME_MS[timeframe]
+        except KeyError:
+            raise ValueError(f"Unsupported timeframe: {timeframe}") from None
+        
+        return time.time() * 1000 >= ohlcv[-1, 0] + duration
+    
+    def _fetch_candles(self, exchange, timeframe: str, limit: int) -> np.ndarray:
+        """
+        Fetch the latest candles, downloading only what changed since the last call.
+        
+        Candles from the previous fetch are kept and only bars from the last
+        known (possibly still forming) bar onwards are requested. A full
+        download is done on the first call, when more candles are requested
+        than are held, or when the new bars do not join up with the old ones.
+        
+        Args:
+            exchange: ccxt exchange instance used by the calling thread
+            timeframe: Timeframe to fetch
+            limit: Number of candles to return
+            
+        Returns:
+            float64 array of shape (N, 6), at most limit rows
+        """
+        previous = self.cache.get(timeframe)
+        if previous is None or len(previous) < limit:
+            rows = exchange.fetch_ohlcv(symbol=self.symbol, timeframe=timeframe, limit=limit)
+            return np.asarray(rows, dtype=np.float64).reshape(-1, 6)
+        
+        rows = exchange.fetch_ohlcv(
+            symbol=self.symbol,
+            timeframe=timeframe,
+            since=int(previous[-1, 0]),
+            limit=limit
+        )
+        new = np.asarray(rows, dtype=np.float64).reshape(-1, 6)
+        
+        # A full page may hide a gap, and bars that start after the last
+        # known one mean something was missed: fall back to a full download
+        if len(new) >= limit or (len(new) and new[0, 0] > previous[-1, 0]):
+            rows = exchange.fetch_ohlcv(symbol=self.symbol, timeframe=timeframe, limit=limit)
+            return np.asarray(rows, dtype=np.float64).reshape(-1, 6)
+        
+        if not len(new):
+            return previous[-limit:]
+        
+        # New bars replace the old copy of the last bar (it may have changed)
+        keep = np.searchsorted(previous[:, 0], new[0, 0], side="left")
+        return np.concatenate((previous[:keep], new))[-limit:]
+    
     def fetch_all_timeframes(self, limit: int = 100) -> Dict[str, MarketData]:
         """
         Fetch OHLCV data for all configured timeframes.
@@ -131,10 +260,19 @@ class MarketMonitor:
         """
         result = {}
         
-        for timeframe in self.timeframes:
+        if not self.timeframes:
+            return result
+        
+        # Fetches are I/O bound, so issue them concurrently: wall time becomes
+        # the slowest request instead of the sum of all of them
+        futures = {
+            timeframe: self._executor.submit(self._fetch_in_worker, timeframe, limit)
+            for timeframe in self.timeframes
+        }
+        
+        for timeframe, future in futures.items():
             try:
-                market_data = self.fetch_ohlcv(timeframe, limit)
-                result[timeframe] = market_data
+                result[timeframe] = future.result()
             except Exception as e:
                 logger.error(
                     "Failed to fetch timeframe data",
@@ -153,6 +291,23 @@ class MarketMonitor:
         
         return result
     
+    def _fetch_in_worker(self, timeframe: str, limit: int) -> MarketData:
+        """
+        Fetch one timeframe on a pool thread with that thread's exchange.
+        
+        Args:
+            timeframe: Timeframe to fetch
+            limit: Number of candles to fetch
+            
+        Returns:
+            MarketData object with OHLCV data
+        """
+        return self._fetch_ohlcv(self._worker_exchange(), timeframe, limit)
+    
+    def close(self):
+        """Shut down the fetch thread pool."""
+        self._executor.shutdown(wait=True)
+    
     def get_cached_data(self, timeframe: str) -> Optional[pd.DataFrame]:
         """
         Get cached data for a specific timeframe.
@@ -163,7 +318,10 @@ class MarketMonitor:
         Returns:
             DataFrame with cached OHLCV data or None if not cached
         """
-        return self.cache.get(timeframe)
+        candles = self.cache.get(timeframe)
+        if candles is None:
+            return None
+        return pd.DataFrame(candles, columns=OHLCV_COLUMNS, copy=False)
     
     def get_latest_price(self) -> float:
         """
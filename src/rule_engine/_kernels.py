@@ -0,0 +1,183 @@
+"""
+Numeric kernels for the Rule Engine.
+
+Plain loops over contiguous float64 arrays, compiled with Numba when it is
+installed (see src.common._njit). They contain no pandas or model objects
+so they can run in nopython mode.
+"""
+import math
+
+import numpy as np
+
+from src.common._njit import njit
+
+
+@njit(cache=True)
+def pivot_points(values: np.ndarray, left: int, right: int, find_high: bool) -> np.ndarray:
+    """
+    Mark strict pivot highs/lows.
+    
+    A bar is a pivot when its value is the unique extreme of the window
+    [i - left, i + right] and every value in the window is finite.
+    
+    Args:
+        values: Highs (find_high=True) or lows (find_high=False)
+        left: Bars to the left of the pivot
+        right: Bars to the right of the pivot
+        find_high: Search for highs if True, lows otherwise
+        
+    Returns:
+        Boolean array of len(values)
+    """
+    n = values.shape[0]
+    piv = np.zeros(n, dtype=np.bool_)
+    
+    for i in range(left, n - right):
+        val = values[i]
+        if not math.isfinite(val):
+            continue
+        
+        is_pivot = True
+        for j in range(i - left, i + right + 1):
+            if j == i:
+                continue
+            other = values[j]
+            if not math.isfinite(other):
+                is_pivot = False
+                break
+            if find_high:
+                if other >= val:
+                    is_pivot = False
+                    break
+            elif other <= val:
+                is_pivot = False
+                break
+        
+        piv[i] = is_pivot
+    
+    return piv
+
+
+@njit(cache=True)
+def recent_breakout_close(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    threshold: float,
+    start: int,
+    close_pos_min: float,
+) -> int:
+    """
+    Find the most recent bar whose close crosses above threshold with a strong close.
+    
+    Args:
+        high: Highs
+        low: Lows
+        close: Closes
+        threshold: Level plus breakout buffer
+        start: First bar index to consider (>= 1)
+        close_pos_min: Minimum close location within the candle range (0..1)
+        
+    Returns:
+        Bar index, or -1 if no breakout was found
+    """
+    for i in range(close.shape[0] - 1, start - 1, -1):
+        if close[i] > threshold and close[i - 1] <= threshold:
+            rng = max(high[i] - low[i], 1e-12)
+            if (close[i] - low[i]) / rng >= close_pos_min:
+                return i
+    return -1
+
+
+@njit(cache=True)
+def best_level(piv_prices: np.ndarray, piv_idx: np.ndarray, tol: float, min_touches: int):
+    """
+    Pick the best multi-touch level from a set of pivots.
+    
+    Every pivot is tried as a level candidate; the pivots within tol of it
+    count as touches. Candidates score touches * 10_000 + last touch index,
+    the first candidate wins ties.
+    
+    Args:
+        piv_prices: Pivot prices
+        piv_idx: Bar index of each pivot
+        tol: Zone tolerance (absolute price)
+        min_touches: Minimum touches for a candidate to count
+        
+    Returns:
+        (level, touches, last_touch_index); touches is 0 if no candidate qualified
+    """
+    best_score = -1
+    best_price = 0.0
+    best_touches = 0
+    best_last = -1
+    
+    for j in range(piv_prices.shape[0]):
+        mask = np.abs(piv_prices - piv_prices[j]) <= tol
+        touches = int(mask.sum())
+        if touches < min_touches:
+            continue
+        
+        last_touch = int(piv_idx[mask].max())
+        score = touches * 10_000 + last_touch
+        if score > best_score:
+            best_score = score
+            best_price = float(np.median(piv_prices[mask]))
+            best_touches = touches
+            best_last = last_touch
+    
+    return best_price, best_touches, best_last
+
+
+@njit(cache=True)
+def retest_reclaim(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    start: int,
+    zone_low: float,
+    zone_high: float,
+    max_touch_age: int,
+    lookahead: int,
+    close_pos_min: float,
+):
+    """
+    Find the most recent zone retest and the candle that reclaims the zone.
+    
+    Walks back from the last bar to the latest candle intersecting
+    [zone_low, zone_high], then forward over at most `lookahead` candles for
+    a bullish close above zone_high with a strong close location.
+    
+    Args:
+        open_: Opens
+        high: Highs
+        low: Lows
+        close: Closes
+        start: First bar index the retest may occur at
+        zone_low: Lower zone bound
+        zone_high: Upper zone bound (reclaim level)
+        max_touch_age: Maximum bars between the touch and the last bar
+        lookahead: Candles after the touch searched for the reclaim
+        close_pos_min: Minimum close location within the candle range (0..1)
+        
+    Returns:
+        (touch index, reclaim index); -1 where none was found (the reclaim
+        is -1 as well when the touch is too old)
+    """
+    n = close.shape[0]
+    touch = -1
+    for k in range(n - 1, start - 1, -1):
+        if low[k] <= zone_high and high[k] >= zone_low:
+            touch = k
+            break
+    
+    if touch < 0 or n - 1 - touch > max_touch_age:
+        return touch, -1
+    
+    for k in range(touch + 1, min(n, touch + 1 + lookahead)):
+        c = close[k]
+        rng = max(high[k] - low[k], 1e-12)
+        if c > zone_high and c > open_[k] and (c - low[k]) / rng >= close_pos_min:
+            return touch, k
+    return touch, -1
@@ -1,16 +1,25 @@
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import structlog
 
 from src.common.models import MarketData, SetupEvent, PatternType, Timeframe
+from src.rule_engine._kernels import (
+    best_level,
+    pivot_points,
+    recent_breakout_close,
+    retest_reclaim,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Value -> member lookup, avoids EnumMeta.__call__ + exception handling per key
+_TIMEFRAME_BY_VALUE: Dict[str, Timeframe] = {tf.value: tf for tf in Timeframe}
+
 
 @dataclass(frozen=True)
 class RuleParams:
@@ -61,6 +70,11 @@ class RuleEngine:
     def __init__(self, params: Optional[RuleParams] = None):
         self.p = params or RuleParams()
         self._last_emitted: Dict[Tuple[str, PatternType], Dict[str, Any]] = {}
+        # (symbol, timeframe, kind) -> ((last bar time, bar count), level info);
+        # a level only changes when a new bar closes
+        self._level_cache: Dict[
+            Tuple[str, Timeframe, str], Tuple[Tuple[Any, int], Optional[Dict[str, Any]]]
+        ] = {}
         logger.info("Rule Engine initialized", params=self.p)
 
     def detect_setups(
@@ -74,12 +88,16 @@ class RuleEngine:
 
         setups: List[SetupEvent] = []
 
+        # Frames are built on first use and shared by all checkers (the 4h
+        # frame feeds both the bounce and the rejection check)
+        frames: Dict[Timeframe, pd.DataFrame] = {}
+
         for checker in (
             self._check_breakout_retest,
             self._check_support_bounce,
             self._check_resistance_rejection,
         ):
-            ev = checker(md)
+            ev = checker(md, frames)
             if ev is not None and self._should_emit(ev):
                 setups.append(ev)
 
@@ -99,7 +117,7 @@ class RuleEngine:
     # -----------------------
 
     def _check_breakout_retest(
-        self, md: Dict[Timeframe, MarketData]
+        self, md: Dict[Timeframe, MarketData], frames: Dict[Timeframe, pd.DataFrame]
     ) -> Optional[SetupEvent]:
         """
         BREAKOUT + RETEST (long bias):
@@ -112,10 +130,8 @@ class RuleEngine:
         if Timeframe.ONE_DAY not in md or Timeframe.FIFTEEN_MIN not in md:
             return None
 
-        d = self._to_df(md[Timeframe.ONE_DAY])
-        i = self._to_df(md[Timeframe.FIFTEEN_MIN])
-
-        if len(d) < self.p.min_bars_1d or len(i) < self.p.min_bars_15m:
+        d = self._frame(md, frames, Timeframe.ONE_DAY)
+        if len(d) < self.p.min_bars_1d:
             return None
 
         atr_d = self._atr(d, period=14)
@@ -128,7 +144,9 @@ class RuleEngine:
             return None
 
         # 1) Find resistance (multi-touch pivots)
-        level_info = self._find_level(
+        level_info = self._cached_level(
+            symbol=md[Timeframe.ONE_DAY].symbol,
+            timeframe=Timeframe.ONE_DAY,
             df=d,
             kind="resistance",
             atr=atr_d,
@@ -151,49 +169,47 @@ class RuleEngine:
         if breakout_idx is None:
             return None
 
+        # Most passes end above (no recent breakout), so the 15m frame is only
+        # built once there is a breakout to look for a retest of
+        i = self._frame(md, frames, Timeframe.FIFTEEN_MIN)
+        if len(i) < self.p.min_bars_15m:
+            return None
+
         breakout_ts = d["timestamp"].iloc[breakout_idx]
 
-        # 3) Retest must occur AFTER breakout (on 15m)
-        i_after = i[i["timestamp"] >= breakout_ts].reset_index(drop=True)
-        if len(i_after) < 40:
+        # 3) Retest must occur AFTER breakout (on 15m). Timestamps are sorted
+        # by _to_df, so a binary search replaces the full boolean scan.
+        start = int(i["timestamp"].searchsorted(breakout_ts, side="left"))
+        if len(i) - start < 40:
             return None
 
         zone_low = resistance - tol
         zone_high = resistance + tol
 
-        touched_mask = (i_after["low"] <= zone_high) & (i_after["high"] >= zone_low)
-        touch_idxs = np.flatnonzero(touched_mask.to_numpy())
-
-        if len(touch_idxs) == 0:
-            return None
-
-        # Use the most recent touch, but not too old
-        touch_idx = int(touch_idxs[-1])
-        if (len(i_after) - 1 - touch_idx) > self.p.retest_max_bars_15m:
-            return None
-
-        # 4) Reclaim confirmation: after touch, find first candle that closes back above zone_high
-        confirm_window = i_after.iloc[
-            touch_idx + 1 : touch_idx + 1 + self.p.reclaim_lookahead_15m
-        ]
-        if len(confirm_window) == 0:
-            return None
-
-        confirm_idx = None
-        for k in range(len(confirm_window)):
-            row = confirm_window.iloc[k]
-            if self._bullish_reclaim(row, zone_high):
-                confirm_idx = touch_idx + 1 + k
-                break
-
-        if confirm_idx is None:
+        # 4) Most recent zone touch (not too old), then the first candle after
+        # it that closes back above zone_high, in one pass over the 15m tail
+        touch_idx, confirm_idx = retest_reclaim(
+            i["open"].to_numpy(dtype=np.float64),
+            i["high"].to_numpy(dtype=np.float64),
+            i["low"].to_numpy(dtype=np.float64),
+            i["close"].to_numpy(dtype=np.float64),
+            start,
+            zone_low,
+            zone_high,
+            self.p.retest_max_bars_15m,
+            self.p.reclaim_lookahead_15m,
+            self.p.close_pos_min,
+        )
+        if confirm_idx < 0:
             return None
 
-        signal_row = i_after.iloc[confirm_idx]
-        signal_ts = pd.Timestamp(signal_row["timestamp"]).to_pydatetime()
+        signal_row = self._row(i, confirm_idx)
+        # Setups are stamped with their signal bar's time (timestamps are
+        # already Timestamps here), never the wall clock
+        signal_ts = signal_row["timestamp"].to_pydatetime()
 
         # Deterministic "quality hints" (NOT a decision)
-        breakout_row = d.iloc[breakout_idx]
+        breakout_row = self._row(d, breakout_idx)
         quality = self._quality_breakout_retest(
             d, breakout_idx, touches, atr_d, resistance, signal_row
         )
@@ -207,15 +223,15 @@ class RuleEngine:
             context_data={
                 "direction_bias": "long",
                 "level": {
-                    "resistance": float(resistance),
-                    "zone_low": float(zone_low),
-                    "zone_high": float(zone_high),
-                    "touches": int(touches),
-                    "tolerance": float(tol),
+                    "resistance": resistance,
+                    "zone_low": zone_low,
+                    "zone_high": zone_high,
+                    "touches": touches,
+                    "tolerance": tol,
                 },
                 "volatility": {
-                    "atr_14": float(atr_d),
-                    "atr_pct": float(atr_pct),
+                    "atr_14": atr_d,
+                    "atr_pct": atr_pct,
                 },
                 "breakout": {
                     "daily_breakout_bar_time": breakout_ts.isoformat(),
@@ -228,12 +244,8 @@ class RuleEngine:
                     },
                 },
                 "retest": {
-                    "touch_bar_time": pd.Timestamp(
-                        i_after.iloc[touch_idx]["timestamp"]
-                    ).isoformat(),
-                    "confirm_bar_time": pd.Timestamp(
-                        signal_row["timestamp"]
-                    ).isoformat(),
+                    "touch_bar_time": i["timestamp"].iat[touch_idx].isoformat(),
+                    "confirm_bar_time": signal_row["timestamp"].isoformat(),
                     "confirm_bar_ohlc": {
                         "open": float(signal_row["open"]),
                         "high": float(signal_row["high"]),
@@ -253,7 +265,7 @@ class RuleEngine:
         )
 
     def _check_support_bounce(
-        self, md: Dict[Timeframe, MarketData]
+        self, md: Dict[Timeframe, MarketData], frames: Dict[Timeframe, pd.DataFrame]
     ) -> Optional[SetupEvent]:
         """
         SUPPORT BOUNCE (long bias):
@@ -265,10 +277,16 @@ class RuleEngine:
         if Timeframe.FOUR_HOURS not in md:
             return None
 
-        df = self._to_df(md[Timeframe.FOUR_HOURS])
+        df = self._frame(md, frames, Timeframe.FOUR_HOURS)
         if len(df) < self.p.min_bars_4h:
             return None
 
+        # The candle shape does not depend on the level: check it before ATR
+        # and level detection, which most bars never need
+        last = self._row(df, -1)
+        if not self._bullish_rejection(last):
+            return None
+
         atr = self._atr(df, period=14)
         if not np.isfinite(atr):
             return None
@@ -278,7 +296,9 @@ class RuleEngine:
         if atr_pct < self.p.min_atr_pct_4h:
             return None
 
-        level_info = self._find_level(
+        level_info = self._cached_level(
+            symbol=md[Timeframe.FOUR_HOURS].symbol,
+            timeframe=Timeframe.FOUR_HOURS,
             df=df,
             kind="support",
             atr=atr,
@@ -294,18 +314,14 @@ class RuleEngine:
         zone_low = support - tol
         zone_high = support + tol
 
-        last = df.iloc[-1]
         if not self._intersects_zone(last, zone_low, zone_high):
             return None
 
-        if not self._bullish_rejection(last):
-            return None
-
         # close must be at/above support (avoid "falling knife" closes below level)
         if float(last["close"]) < support:
             return None
 
-        signal_ts = pd.Timestamp(last["timestamp"]).to_pydatetime()
+        signal_ts = last["timestamp"].to_pydatetime()
         quality = self._quality_bounce_rejection(
             df, touches, atr, support, last, kind="support"
         )
@@ -319,18 +335,18 @@ class RuleEngine:
             context_data={
                 "direction_bias": "long",
                 "level": {
-                    "support": float(support),
-                    "zone_low": float(zone_low),
-                    "zone_high": float(zone_high),
-                    "touches": int(touches),
-                    "tolerance": float(tol),
+                    "support": support,
+                    "zone_low": zone_low,
+                    "zone_high": zone_high,
+                    "touches": touches,
+                    "tolerance": tol,
                 },
                 "volatility": {
-                    "atr_14": float(atr),
-                    "atr_pct": float(atr_pct),
+                    "atr_14": atr,
+                    "atr_pct": atr_pct,
                 },
                 "signal_bar": {
-                    "time": pd.Timestamp(last["timestamp"]).isoformat(),
+                    "time": last["timestamp"].isoformat(),
                     "open": float(last["open"]),
                     "high": float(last["high"]),
                     "low": float(last["low"]),
@@ -348,7 +364,7 @@ class RuleEngine:
         )
 
     def _check_resistance_rejection(
-        self, md: Dict[Timeframe, MarketData]
+        self, md: Dict[Timeframe, MarketData], frames: Dict[Timeframe, pd.DataFrame]
     ) -> Optional[SetupEvent]:
         """
         RESISTANCE REJECTION (short bias):
@@ -361,10 +377,14 @@ class RuleEngine:
         if Timeframe.FOUR_HOURS not in md:
             return None
 
-        df = self._to_df(md[Timeframe.FOUR_HOURS])
+        df = self._frame(md, frames, Timeframe.FOUR_HOURS)
         if len(df) < self.p.min_bars_4h:
             return None
 
+        last = self._row(df, -1)
+        if not self._bearish_rejection(last):
+            return None
+
         atr = self._atr(df, period=14)
         if not np.isfinite(atr):
             return None
@@ -374,7 +394,9 @@ class RuleEngine:
         if atr_pct < self.p.min_atr_pct_4h:
             return None
 
-        level_info = self._find_level(
+        level_info = self._cached_level(
+            symbol=md[Timeframe.FOUR_HOURS].symbol,
+            timeframe=Timeframe.FOUR_HOURS,
             df=df,
             kind="resistance",
             atr=atr,
@@ -390,17 +412,13 @@ class RuleEngine:
         zone_low = resistance - tol
         zone_high = resistance + tol
 
-        last = df.iloc[-1]
         if not self._intersects_zone(last, zone_low, zone_high):
             return None
 
-        if not self._bearish_rejection(last):
-            return None
-
         if float(last["close"]) > resistance:
             return None
 
-        signal_ts = pd.Timestamp(last["timestamp"]).to_pydatetime()
+        signal_ts = last["timestamp"].to_pydatetime()
         quality = self._quality_bounce_rejection(
             df, touches, atr, resistance, last, kind="resistance"
         )
@@ -414,18 +432,18 @@ class RuleEngine:
             context_data={
                 "direction_bias": "short",
                 "level": {
-                    "resistance": float(resistance),
-                    "zone_low": float(zone_low),
-                    "zone_high": float(zone_high),
-                    "touches": int(touches),
-                    "tolerance": float(tol),
+                    "resistance": resistance,
+                    "zone_low": zone_low,
+                    "zone_high": zone_high,
+                    "touches": touches,
+                    "tolerance": tol,
                 },
                 "volatility": {
-                    "atr_14": float(atr),
-                    "atr_pct": float(atr_pct),
+                    "atr_14": atr,
+                    "atr_pct": atr_pct,
                 },
                 "signal_bar": {
-                    "time": pd.Timestamp(last["timestamp"]).isoformat(),
+                    "time": last["timestamp"].isoformat(),
                     "open": float(last["open"]),
                     "high": float(last["high"]),
                     "low": float(last["low"]),
@@ -488,44 +506,57 @@ class RuleEngine:
             if isinstance(k, Timeframe):
                 out[k] = v
                 continue
-            try:
-                out[Timeframe(str(k))] = v
-            except Exception:
-                # Ignore unknown keys
-                continue
+            tf = _TIMEFRAME_BY_VALUE.get(str(k))
+            if tf is not None:
+                out[tf] = v
+            # Ignore unknown keys
         return out
 
     # -----------------------
     # Helpers: Data / Indicators
     # -----------------------
 
+    def _frame(
+        self,
+        md: Dict[Timeframe, MarketData],
+        frames: Dict[Timeframe, pd.DataFrame],
+        timeframe: Timeframe,
+    ) -> pd.DataFrame:
+        """Return the cleaned frame for a timeframe, building it once per detection pass."""
+        df = frames.get(timeframe)
+        if df is None:
+            df = frames[timeframe] = self._to_df(md[timeframe])
+        return df
+
     def _to_df(self, data: MarketData) -> pd.DataFrame:
-        df = pd.DataFrame(
-            data.ohlcv,
-            columns=["timestamp", "open", "high", "low", "close", "volume"],
-        ).copy()
-
-        # Sort + clean
-        df = df.dropna()
-        df["timestamp"] = pd.to_numeric(df["timestamp"], errors="coerce")
-        df = (
-            df.dropna(subset=["timestamp"])
-            .sort_values("timestamp")
-            .drop_duplicates("timestamp")
-        )
-        df = df.reset_index(drop=True)
+        # ohlcv is already a float64 (N, 6) array, so clean it in numpy and
+        # hand pandas the column views instead of re-parsing every row
+        arr = data.ohlcv
+        arr = arr[~np.isnan(arr).any(axis=1)]
+
+        # Sort + drop duplicate timestamps (np.unique returns them sorted)
+        _, first_idx = np.unique(arr[:, 0], return_index=True)
+        arr = arr[first_idx]
 
         # Convert epoch seconds vs ms -> timezone-aware datetime
-        ts = df["timestamp"].astype(float)
+        ts = arr[:, 0]
         # crude but practical detection
-        unit = "ms" if float(ts.iloc[-1]) > 1e11 else "s"
-        df["timestamp"] = pd.to_datetime(ts, unit=unit, utc=True)
-
-        for col in ["open", "high", "low", "close", "volume"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+        unit = "ms" if float(ts[-1]) > 1e11 else "s"
+
+        return pd.DataFrame(
+            {
+                "timestamp": pd.to_datetime(ts, unit=unit, utc=True),
+                "open": arr[:, 1],
+                "high": arr[:, 2],
+                "low": arr[:, 3],
+                "close": arr[:, 4],
+                "volume": arr[:, 5],
+            }
+        )
 
-        df = df.dropna(subset=["open", "high", "low", "close"]).reset_index(drop=True)
-        return df
+    def _row(self, df: pd.DataFrame, idx: int) -> Dict[str, Any]:
+        """Read one candle as scalars, without materializing a row Series."""
+        return {col: df[col].iat[idx] for col in df.columns}
 
     def _atr(self, df: pd.DataFrame, period: int = 14) -> float:
         high = df["high"].to_numpy(dtype=float)
@@ -541,8 +572,8 @@ class RuleEngine:
         if len(tr) < period + 1:
             return float("nan")
 
-        atr = pd.Series(tr).rolling(period).mean().iloc[-1]
-        return float(atr)
+        # Last value of the rolling mean == mean of the last `period` ranges
+        return float(tr[-period:].mean())
 
     def _pivot_points(
         self, arr: np.ndarray, left: int, right: int, mode: str
@@ -551,27 +582,41 @@ class RuleEngine:
         Returns boolean array indicating pivot highs/lows.
         Strict pivot: value must be unique extreme inside window.
         """
-        n = len(arr)
-        piv = np.zeros(n, dtype=bool)
+        if mode not in ("high", "low"):
+            raise ValueError("mode must be 'high' or 'low'")
 
-        for i in range(left, n - right):
-            window = arr[i - left : i + right + 1]
-            if not np.all(np.isfinite(window)):
-                continue
+        return pivot_points(
+            np.ascontiguousarray(arr, dtype=np.float64), left, right, mode == "high"
+        )
+
+    def _cached_level(
+        self,
+        symbol: str,
+        timeframe: Timeframe,
+        df: pd.DataFrame,
+        kind: str,
+        atr: float,
+        max_age_bars: int,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the _find_level result, reusing it until a new bar arrives.
 
-            val = arr[i]
-            if mode == "high":
-                m = window.max()
-                if val == m and np.sum(window == m) == 1:
-                    piv[i] = True
-            elif mode == "low":
-                m = window.min()
-                if val == m and np.sum(window == m) == 1:
-                    piv[i] = True
-            else:
-                raise ValueError("mode must be 'high' or 'low'")
+        Monitoring cycles are far more frequent than 1d/4h closes, so most
+        passes see the same bars and would recompute the same level. Bar
+        timestamps only grow, so the last one (plus the bar count) is enough
+        to detect new data.
+        """
+        stamp = (df["timestamp"].iat[-1], len(df))
+        key = (symbol, timeframe, kind)
+        cached = self._level_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
 
-        return piv
+        level_info = self._find_level(
+            df=df, kind=kind, atr=atr, max_age_bars=max_age_bars
+        )
+        self._level_cache[key] = (stamp, level_info)
+        return level_info
 
     def _find_level(
         self,
@@ -621,28 +666,19 @@ class RuleEngine:
             return None
 
         # Score candidate levels by how many pivots fall within tolerance
-        best = None
-        for j in range(len(piv_prices)):
-            level0 = piv_prices[j]
-            mask = np.abs(piv_prices - level0) <= tol
-            touches = int(mask.sum())
-            if touches < self.p.min_level_touches:
-                continue
-
-            level = float(np.median(piv_prices[mask]))
-            last_touch = int(np.max(piv_idx[mask]))
-
-            score = (touches * 10_000) + last_touch  # deterministic scoring
-            if best is None or score > best["score"]:
-                best = {
-                    "level": level,
-                    "touches": touches,
-                    "last_touch_index": last_touch,
-                    "tolerance": float(tol),
-                    "score": score,
-                }
+        level, touches, last_touch = best_level(
+            piv_prices, piv_idx, float(tol), self.p.min_level_touches
+        )
+        if touches == 0:
+            return None
 
-        return best
+        return {
+            "level": float(level),
+            "touches": int(touches),
+            "last_touch_index": int(last_touch),
+            "tolerance": float(tol),
+            "score": int(touches) * 10_000 + int(last_touch),  # deterministic scoring
+        }
 
     # -----------------------
     # Helpers: Pattern Conditions
@@ -654,45 +690,34 @@ class RuleEngine:
         """
         Find a recent bar where CLOSE crosses above level with buffer.
         """
-        closes = df["close"].to_numpy(dtype=float)
-
         buffer = max(level * 0.002, atr * self.p.breakout_close_buffer_atr)
         threshold = level + buffer
 
         start = max(1, len(df) - max_age_bars - 1)
-        for i in range(len(df) - 1, start - 1, -1):
-            if closes[i] > threshold and closes[i - 1] <= threshold:
-                # Also require breakout candle closes relatively strong
-                row = df.iloc[i]
-                if self._close_position(row) >= self.p.close_pos_min:
-                    return i
-        return None
+        # Also require breakout candle closes relatively strong
+        idx = recent_breakout_close(
+            df["high"].to_numpy(dtype=np.float64),
+            df["low"].to_numpy(dtype=np.float64),
+            df["close"].to_numpy(dtype=np.float64),
+            threshold,
+            start,
+            self.p.close_pos_min,
+        )
+        return int(idx) if idx >= 0 else None
 
     def _intersects_zone(
-        self, row: pd.Series, zone_low: float, zone_high: float
+        self, row: Mapping[str, Any], zone_low: float, zone_high: float
     ) -> bool:
         return (float(row["low"]) <= zone_high) and (float(row["high"]) >= zone_low)
 
-    def _close_position(self, row: pd.Series) -> float:
+    def _close_position(self, row: Mapping[str, Any]) -> float:
         lo = float(row["low"])
         hi = float(row["high"])
         c = float(row["close"])
         rng = max(hi - lo, 1e-12)
         return (c - lo) / rng  # 0..1
 
-    def _bullish_reclaim(self, row: pd.Series, reclaim_above: float) -> bool:
-        # close back above reclaim_above + strong close in candle
-        c = float(row["close"])
-        o = float(row["open"])
-        if c <= reclaim_above:
-            return False
-        if c <= o:
-            return False
-        if self._close_position(row) < self.p.close_pos_min:
-            return False
-        return True
-
-    def _bullish_rejection(self, row: pd.Series) -> bool:
+    def _bullish_rejection(self, row: Mapping[str, Any]) -> bool:
         o = float(row["open"])
         c = float(row["close"])
         h = float(row["high"])
@@ -711,7 +736,7 @@ class RuleEngine:
 
         return True
 
-    def _bearish_rejection(self, row: pd.Series) -> bool:
+    def _bearish_rejection(self, row: Mapping[str, Any]) -> bool:
         o = float(row["open"])
         c = float(row["close"])
         h = float(row["high"])
@@ -744,16 +769,17 @@ class RuleEngine:
         touches: int,
         atr: float,
         level: float,
-        confirm_row_15m: pd.Series,
+        confirm_row_15m: Mapping[str, Any],
     ) -> Dict[str, Any]:
-        br = df_daily.iloc[breakout_idx]
+        br = self._row(df_daily, breakout_idx)
         close_pos = self._close_position(br)
 
         # volume boost (simple)
         vol = float(br["volume"])
+        # 20-bar volume average ending at the breakout bar (NaN without 20 bars)
         vol_ma = (
-            float(df_daily["volume"].rolling(20).mean().iloc[breakout_idx])
-            if "volume" in df_daily
+            float(df_daily["volume"].to_numpy()[breakout_idx - 19 : breakout_idx + 1].mean())
+            if "volume" in df_daily and breakout_idx >= 19
             else float("nan")
         )
         vol_ok = np.isfinite(vol_ma) and vol_ma > 0 and vol > 1.2 * vol_ma
@@ -771,7 +797,7 @@ class RuleEngine:
 
         return {
             "score_0_10": int(min(score, 10)),
-            "touches": int(touches),
+            "touches": touches,
             "breakout_close_position": float(close_pos),
             "breakout_volume_boost": bool(vol_ok),
             "retest_depth_vs_atr": float(depth / max(atr, 1e-12)),
@@ -783,7 +809,7 @@ class RuleEngine:
         touches: int,
         atr: float,
         level: float,
-        signal_row: pd.Series,
+        signal_row: Mapping[str, Any],
         kind: str,
     ) -> Dict[str, Any]:
         close_pos = self._close_position(signal_row)
@@ -813,7 +839,7 @@ class RuleEngine:
 
         return {
             "score_0_10": int(min(score, 10)),
-            "touches": int(touches),
+            "touches": touches,
             "wick_fraction": float(wick),
             "close_position": float(close_pos),
             "depth_vs_atr": float(depth),
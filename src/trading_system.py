@@ -4,11 +4,11 @@ Main Trading System Orchestrator.
 This module coordinates all components of the trading system.
 """
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import structlog
 
-from src.common.models import SetupEvent, AIDecision, Trade
+from src.common.models import SetupEvent, AIDecision, AIDecisionOutput, Trade, TradeStatus
 from src.common.logging_utils import setup_logging
 from src.config import config
 from src.market_monitor import MarketMonitor
@@ -95,23 +95,20 @@ class TradingSystem:
             logger.info("Step 2: Detecting setups")
             setups = self.rule_engine.detect_setups(market_data)
             
-            # Step 3: Process each setup
-            for setup in setups:
-                self._process_setup(setup, market_data)
-            
-            # Step 4: Re-evaluate pending setups (WAIT decisions)
-            self._reevaluate_pending_setups(market_data)
+            # Step 3 + 4: Validate new setups and re-evaluate pending setups
+            # (WAIT decisions) in one concurrent AI batch
+            self._process_setups(setups, market_data)
             
             # Step 5: Monitor open trades
             logger.info("Step 5: Monitoring open trades")
             current_prices = {
-                symbol: data.ohlcv[-1][4] if data.ohlcv else 0  # Get close price
+                symbol: data.ohlcv[-1][4] if len(data.ohlcv) else 0  # Get close price
                 for symbol, data in market_data.items()
             }
             # Convert timeframe keys to symbol
             symbol = self.market_monitor.symbol
             if market_data:
-                latest_price = list(market_data.values())[0].ohlcv[-1][4] if list(market_data.values())[0].ohlcv else 0
+                latest_price = list(market_data.values())[0].ohlcv[-1][4] if len(list(market_data.values())[0].ohlcv) else 0
                 self.trade_monitor.check_trades({symbol: latest_price})
             
             logger.info(
@@ -123,13 +120,47 @@ class TradingSystem:
         except Exception as e:
             logger.error("Error in trading cycle", error=str(e), exc_info=True)
     
-    def _process_setup(self, setup: SetupEvent, market_data: Dict):
+    def _process_setups(self, setups: List[SetupEvent], market_data: Dict):
+        """
+        Validate detected and pending setups in a single AI batch.
+        
+        All LLM round-trips of a cycle run concurrently, so the cycle waits
+        for the slowest call instead of the sum of all calls.
+        
+        Args:
+            setups: Setups detected in this cycle
+            market_data: Current market data
+        """
+        pending = self._collect_pending_setups()
+        if not setups and not pending:
+            return
+        
+        # Get current price for AI validation
+        current_price = self.market_monitor.get_latest_price()
+        
+        # Step 3: Validate with AI
+        logger.info(
+            "Step 3: Validating setups with AI",
+            new_setups=len(setups),
+            pending_setups=len(pending)
+        )
+        batch = setups + [entry["setup"] for _, entry in pending]
+        decisions = self.ai_decision_engine.validate_setups(batch, market_data, current_price)
+        
+        for setup, ai_decision in zip(setups, decisions):
+            self._process_setup(setup, ai_decision, current_price)
+        
+        # Step 4: Apply re-evaluated pending setups (WAIT decisions)
+        self._reevaluate_pending_setups(pending, decisions[len(setups):], current_price)
+    
+    def _process_setup(self, setup: SetupEvent, ai_decision: AIDecisionOutput, current_price: float):
         """
         Process a detected setup.
         
         Args:
             setup: Detected setup event
-            market_data: Current market data
+            ai_decision: AI decision output for the setup
+            current_price: Current market price
         """
         logger.info(
             "Processing setup",
@@ -137,13 +168,6 @@ class TradingSystem:
             pattern_type=setup.pattern_type
         )
         
-        # Get current price for AI validation
-        current_price = self.market_monitor.get_latest_price()
-        
-        # Step 3: Validate with AI
-        logger.info("Step 3: Validating setup with AI")
-        ai_decision = self.ai_decision_engine.validate_setup(setup, market_data, current_price)
-        
         # Handle AI decision
         if ai_decision.decision == AIDecision.TRADE:
             self._execute_trade(setup, ai_decision, current_price)
@@ -214,52 +238,66 @@ class TradingSystem:
             "recheck_count": 0
         }
     
-    def _reevaluate_pending_setups(self, market_data: Dict):
+    def _collect_pending_setups(self) -> List[Tuple[str, dict]]:
         """
-        Re-evaluate pending setups marked with WAIT.
+        Drop expired pending setups and return the ones to re-validate.
         
-        Args:
-            market_data: Current market data
+        Returns:
+            List of (event_id, pending entry) tuples
         """
         if not self.pending_setups:
-            return
+            return []
         
         logger.info("Re-evaluating pending setups", count=len(self.pending_setups))
         
-        completed_setups = []
-        
-        # Get current price for re-evaluation
-        current_price = self.market_monitor.get_latest_price()
-        
-        for event_id, pending in self.pending_setups.items():
-            setup = pending["setup"]
-            recheck_count = pending["recheck_count"]
-            
+        expired = []
+        pending = []
+        for event_id, entry in self.pending_setups.items():
             # Limit re-checks to avoid infinite loops
-            if recheck_count >= 5:
+            if entry["recheck_count"] >= 5:
                 logger.info(
                     "Setup expired after max re-checks",
                     event_id=event_id
                 )
-                completed_setups.append(event_id)
-                continue
-            
-            # Re-validate with AI
-            ai_decision = self.ai_decision_engine.validate_setup(setup, market_data, current_price)
-            
+                expired.append(event_id)
+            else:
+                pending.append((event_id, entry))
+        
+        for event_id in expired:
+            del self.pending_setups[event_id]
+        
+        return pending
+    
+    def _reevaluate_pending_setups(
+        self,
+        pending: List[Tuple[str, dict]],
+        decisions: List[AIDecisionOutput],
+        current_price: float
+    ):
+        """
+        Apply AI re-evaluation results to pending setups marked with WAIT.
+        
+        Args:
+            pending: (event_id, pending entry) tuples from _collect_pending_setups
+            decisions: AI decisions, one per pending entry
+            current_price: Current market price
+        """
+        completed_setups = []
+        
+        for (event_id, entry), ai_decision in zip(pending, decisions):
             if ai_decision.decision == AIDecision.TRADE:
-                self._execute_trade(setup, ai_decision, current_price)
+                self._execute_trade(entry["setup"], ai_decision, current_price)
                 completed_setups.append(event_id)
             elif ai_decision.decision == AIDecision.NO_TRADE:
                 logger.info("Pending setup rejected", event_id=event_id)
                 completed_setups.append(event_id)
             else:
                 # Still waiting, increment counter
-                pending["recheck_count"] += 1
+                entry["recheck_count"] += 1
                 logger.info(
                     "Setup still pending",
                     event_id=event_id,
-                    recheck_count=pending["recheck_count"]
+                    recheck_count=entry["recheck_count"]
                 )
         
         # Remove completed setups
@@ -281,12 +319,19 @@ class TradingSystem:
         try:
             while True:
                 self.run_cycle()
-                logger.info(f"Waiting {interval_seconds} seconds until next cycle")
+                logger.info("Waiting until next cycle", interval_seconds=interval_seconds)
                 time.sleep(interval_seconds)
         except KeyboardInterrupt:
             logger.info("Trading system stopped by user")
         except Exception as e:
             logger.error("Fatal error in trading system", error=str(e), exc_info=True)
+        finally:
+            self.close()
+    
+    def close(self):
+        """Release network resources held by the components."""
+        self.ai_decision_engine.close()
+        self.market_monitor.close()
     
     def get_statistics(self) -> dict:
         """
@@ -296,7 +341,7 @@ class TradingSystem:
             Dictionary with statistics
         """
         total_trades = len(self.trade_history)
-        closed_trades = [t for t in self.trade_history if t.status.value == "closed"]
+        closed_trades = [t for t in self.trade_history if t.status == TradeStatus.CLOSED]
         winning_trades = [t for t in closed_trades if t.pnl and t.pnl > 0]
         losing_trades = [t for t in closed_trades if t.pnl and t.pnl < 0]
         
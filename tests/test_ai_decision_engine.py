@@ -0,0 +1,308 @@
+"""
+Test AI Decision Engine batch validation.
+"""
+import asyncio
+import json
+import sys
+import os
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# The OpenAI clients refuse to construct without credentials
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from src.ai_decision import AIDecisionEngine
+from src.ai_decision.ai_decision_engine import RESPONSE_CACHE_TTL, RESPONSE_FORMAT
+from src.common.models import (
+    AIDecision,
+    MarketData,
+    PatternType,
+    SetupEvent,
+    Timeframe,
+)
+
+
+class FakeCompletions:
+    """Async chat.completions stand-in that records concurrency."""
+
+    def __init__(self, content: str, delay: float = 0.01):
+        self.content = content
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _make_setup(event_id: str, support: float = 50000.0) -> SetupEvent:
+    return SetupEvent(
+        event_id=event_id,
+        symbol="BTC/USDT",
+        pattern_type=PatternType.SUPPORT_BOUNCE,
+        timestamp=datetime(2024, 1, 1),
+        timeframes=[Timeframe.FOUR_HOURS],
+        context_data={"level": {"support": support}},
+    )
+
+
+def _make_market_data() -> dict:
+    return {
+        "4h": MarketData(
+            symbol="BTC/USDT",
+            timeframe=Timeframe.FOUR_HOURS,
+            timestamp=datetime(2024, 1, 1),
+            ohlcv=[[1704067200000, 50000, 51000, 49000, 50500, 100]],
+        )
+    }
+
+
+def _make_engine(completions: FakeCompletions, max_concurrency: int) -> AIDecisionEngine:
+    engine = AIDecisionEngine()
+    engine.max_concurrency = max_concurrency
+    engine.async_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return engine
+
+
+def test_validate_setups_preserves_order_and_caps_concurrency():
+    """Test batch validation returns one decision per setup, in order."""
+    response = json.dumps({"decision": "NO_TRADE", "confidence": "LOW", "reason_code": "CHOPPY"})
+    completions = FakeCompletions(response)
+    engine = _make_engine(completions, max_concurrency=3)
+
+    setups = [_make_setup(f"setup-{i}", support=50000.0 + i) for i in range(10)]
+    decisions = engine.validate_setups(setups, _make_market_data(), 50500.0)
+
+    assert len(decisions) == len(setups)
+    assert all(d.decision == AIDecision.NO_TRADE for d in decisions)
+    assert completions.calls == len(setups)
+    assert 1 < completions.max_in_flight <= 3
+
+
+def test_validate_setups_returns_safe_default_on_error():
+    """Test a failing LLM call yields NO_TRADE instead of raising."""
+    completions = FakeCompletions("not json")
+    engine = _make_engine(completions, max_concurrency=2)
+
+    decisions = engine.validate_setups([_make_setup("bad")], _make_market_data(), 50500.0)
+
+    assert decisions[0].decision == AIDecision.NO_TRADE
+    assert decisions[0].reason_code == "PARSE_ERROR"
+    with pytest.raises(ValidationError):
+        decisions[0].reason_code = "CHANGED"
+
+
+def test_identical_inputs_hit_response_cache():
+    """Test re-validating an identical setup does not call the LLM again."""
+    response = json.dumps({"decision": "WAIT", "confidence": "MID", "reason_code": "CHOPPY"})
+    completions = FakeCompletions(response)
+    engine = _make_engine(completions, max_concurrency=2)
+
+    setup = _make_setup("repeat")
+    first = engine.validate_setups([setup], _make_market_data(), 50500.0)
+    second = engine.validate_setups([setup], _make_market_data(), 50500.0)
+
+    assert completions.calls == 1
+    assert first[0].decision == second[0].decision == AIDecision.WAIT
+
+
+def test_duplicate_setups_share_one_llm_call():
+    """Test setups with the same fingerprint are validated once."""
+    response = json.dumps({"decision": "NO_TRADE", "confidence": "LOW", "reason_code": "CHOPPY"})
+    completions = FakeCompletions(response)
+    engine = _make_engine(completions, max_concurrency=4)
+
+    setups = [_make_setup("dup-a"), _make_setup("dup-b"), _make_setup("dup-c")]
+    decisions = engine.validate_setups(setups, _make_market_data(), 50500.0)
+
+    assert completions.calls == 1
+    assert len(decisions) == 3
+    assert decisions[1].reason_code == "CHOPPY"
+
+
+def test_redetected_setup_hits_cache_until_ttl_expires():
+    """Test the cache ignores event ids and price noise and honours the TTL."""
+    response = json.dumps({"decision": "WAIT", "confidence": "MID", "reason_code": "CHOPPY"})
+    completions = FakeCompletions(response)
+    engine = _make_engine(completions, max_concurrency=2)
+
+    now = [1000.0]
+    engine._clock = lambda: now[0]
+
+    engine.validate_setups([_make_setup("first")], _make_market_data(), 50500.0)
+    engine.validate_setups([_make_setup("second")], _make_market_data(), 50500.04)
+    assert completions.calls == 1
+
+    now[0] += RESPONSE_CACHE_TTL + 1
+    engine.validate_setups([_make_setup("third")], _make_market_data(), 50500.0)
+    assert completions.calls == 2
+    assert (engine.cache_hits, engine.cache_misses) == (1, 2)
+
+
+def test_timeframe_enum_keys_are_accepted():
+    """Test market data keyed by Timeframe members is serialized."""
+    response = json.dumps({"decision": "NO_TRADE", "confidence": "LOW", "reason_code": "CHOPPY"})
+    completions = FakeCompletions(response)
+    engine = _make_engine(completions, max_concurrency=2)
+
+    market_data = {Timeframe.FOUR_HOURS: _make_market_data()["4h"]}
+    decisions = engine.validate_setups([_make_setup("enum")], market_data, 50500.0)
+
+    assert completions.calls == 1
+    assert decisions[0].reason_code == "CHOPPY"
+
+
+def test_serialize_window_skips_nan_candles_and_keeps_fractional_volume():
+    """Test NaN candles are dropped and small volumes survive encoding."""
+    engine = _make_engine(FakeCompletions("{}"), max_concurrency=1)
+    window = np.array([
+        [1, 100.0, 101.0, 99.0, 100.0, 0.5],
+        [2, 100.0, 102.0, 99.5, 101.0, float("nan")],
+        [3, 101.0, 103.0, 100.0, 102.0, 0.125],
+    ])
+
+    encoded = engine._serialize_window("15m", window)
+
+    assert len(encoded["candles"]) == 2
+    volumes = encoded["candles"][:, 4] * encoded["vol_tick"]
+    assert np.allclose(volumes, [0.5, 0.125])
+
+
+def test_parse_errors_are_not_cached():
+    """Test a malformed reply is retried instead of replayed from the cache."""
+    completions = FakeCompletions("not json")
+    engine = _make_engine(completions, max_concurrency=1)
+
+    engine.validate_setups([_make_setup("bad")], _make_market_data(), 50500.0)
+    completions.content = json.dumps({"decision": "WAIT", "confidence": "MID", "reason_code": "CHOPPY"})
+    decisions = engine.validate_setups([_make_setup("bad")], _make_market_data(), 50500.0)
+
+    assert completions.calls == 2
+    assert decisions[0].decision == AIDecision.WAIT
+
+
+def test_response_format_is_strict():
+    """Test the structured output schema satisfies OpenAI strict mode."""
+    assert RESPONSE_FORMAT["json_schema"]["strict"] is True
+
+    def _check(node):
+        if isinstance(node, dict):
+            assert "default" not in node and "description" not in node
+            if "properties" in node:
+                assert node["additionalProperties"] is False
+                assert set(node["required"]) == set(node["properties"])
+            for value in node.values():
+                _check(value)
+        elif isinstance(node, list):
+            for item in node:
+                _check(item)
+
+    _check(RESPONSE_FORMAT["json_schema"]["schema"])
+
+
+def test_setups_with_different_context_are_not_merged():
+    """Test setups sharing a level but differing elsewhere get their own call."""
+    response = json.dumps({"decision": "NO_TRADE", "confidence": "LOW", "reason_code": "CHOPPY"})
+    completions = FakeCompletions(response)
+    engine = _make_engine(completions, max_concurrency=4)
+
+    first = _make_setup("ctx-a")
+    second = _make_setup("ctx-b")
+    second.context_data["quality"] = {"score": 0.9}
+    engine.validate_setups([first, second], _make_market_data(), 50500.0)
+
+    assert completions.calls == 2
+
+
+def test_async_client_is_rebound_per_event_loop():
+    """Test switching event loops replaces the pooled async client."""
+    response = json.dumps({"decision": "NO_TRADE", "confidence": "LOW", "reason_code": "CHOPPY"})
+    completions = FakeCompletions(response)
+    engine = _make_engine(completions, max_concurrency=1)
+    engine._create_async_client = lambda: SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    engine.validate_setups([_make_setup("loop")], _make_market_data(), 50500.0)
+    private_client = engine.async_client
+
+    asyncio.run(engine.validate_setups_async([_make_setup("loop", support=1.0)], _make_market_data(), 50500.0))
+    assert engine.async_client is not private_client
+
+    engine.close()
+    assert engine._loop is None
+
+
+
+def test_engines_share_pooled_http_clients():
+    """Test engines reuse one sync pool and one async pool per event loop."""
+    first, second = AIDecisionEngine(), AIDecisionEngine()
+    assert first.client._client is second.client._client
+
+    async def bind_both():
+        first._bind_async_client()
+        second._bind_async_client()
+        assert first.async_client._client is second.async_client._client
+        await first.aclose()
+
+    asyncio.run(bind_both())
+
+class FakeBatchClient:
+    """Sync client stand-in for the files/batches endpoints of the Batch API."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.uploaded = []
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch)
+        self.polls = 0
+
+    def _create_file(self, file, purpose):
+        self.uploaded = [json.loads(line) for line in file[1].splitlines()]
+        return SimpleNamespace(id="file-in")
+
+    def _create_batch(self, input_file_id, endpoint, completion_window):
+        return SimpleNamespace(id="batch-1", status="in_progress", output_file_id=None)
+
+    def _retrieve_batch(self, batch_id):
+        self.polls += 1
+        return SimpleNamespace(id=batch_id, status="completed", output_file_id="file-out")
+
+    def _file_content(self, file_id):
+        lines = [
+            json.dumps({
+                "custom_id": request["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": self.content}}]},
+                },
+            })
+            for request in self.uploaded
+        ]
+        return SimpleNamespace(text="\n".join(lines))
+
+
+def test_batch_api_validation_maps_results_back_in_order():
+    """Test Batch API results are matched to setups and duplicates are sent once."""
+    response = json.dumps({"decision": "WAIT", "confidence": "MID", "reason_code": "CHOPPY"})
+    engine = _make_engine(FakeCompletions(response), max_concurrency=1)
+    engine.client = FakeBatchClient(response)
+
+    setups = [_make_setup("a"), _make_setup("b", support=49000.0), _make_setup("a-again")]
+    decisions = engine.validate_setups_batch_api(setups, _make_market_data(), 50500.0, poll_interval=0)
+
+    assert len(engine.client.uploaded) == 2
+    assert engine.client.uploaded[0]["url"] == "/v1/chat/completions"
+    assert [d.decision for d in decisions] == [AIDecision.WAIT] * 3
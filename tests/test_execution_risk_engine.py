@@ -0,0 +1,85 @@
+"""
+Test Execution & Risk Engine order and trade creation.
+"""
+import sys
+import os
+from datetime import datetime
+
+import pytest
+from structlog.testing import capture_logs
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.common.models import (
+    AIConfidence,
+    AIDecision,
+    AIDecisionOutput,
+    OrderSide,
+    PatternType,
+    SetupEvent,
+    Timeframe,
+    TradeStatus,
+)
+from src.execution_risk import ExecutionRiskEngine
+
+
+def _setup() -> SetupEvent:
+    return SetupEvent(
+        event_id="setup-1",
+        symbol="BTC/USDT",
+        pattern_type=PatternType.SUPPORT_BOUNCE,
+        timestamp=datetime(2024, 1, 1),
+        timeframes=[Timeframe.FOUR_HOURS],
+        context_data={},
+    )
+
+
+def _trade_decision(**overrides) -> AIDecisionOutput:
+    fields = dict(
+        decision=AIDecision.TRADE,
+        confidence=AIConfidence.MID,
+        reason_code="CLEAN_SETUP",
+        entry_price=50000.0,
+        stop_loss=49000.0,
+        take_profit=52000.0,
+        side="buy",
+    )
+    fields.update(overrides)
+    return AIDecisionOutput(**fields)
+
+
+def test_order_and_trade_carry_ai_parameters():
+    """Test the order is sized from the risk mapping and the trade copies it."""
+    engine = ExecutionRiskEngine(account_balance=10000.0)
+
+    order = engine.create_trade_order(_setup(), _trade_decision(), current_price=50000.0)
+    assert order.side == OrderSide.BUY
+    assert order.risk_amount == pytest.approx(100.0)  # MID = 1R = 1% of balance
+    assert order.quantity == pytest.approx(0.1)
+
+    trade = engine.execute_order(order)
+    assert trade.trade_id == order.trade_id
+    assert trade.status == TradeStatus.OPEN
+    assert (trade.stop_loss, trade.take_profit) == (49000.0, 52000.0)
+    assert engine.daily_trades == 1
+
+
+def test_invalid_ai_parameters_are_rejected():
+    """Test invalid AI parameters still raise before any order is built."""
+    engine = ExecutionRiskEngine(account_balance=10000.0)
+
+    with pytest.raises(ValueError):
+        engine.create_trade_order(_setup(), _trade_decision(stop_loss=51000.0), current_price=50000.0)
+
+
+def test_cooldown_is_checked_before_the_limits():
+    """Test a TRADE decision in cooldown is rejected for the cooldown, not the limits."""
+    engine = ExecutionRiskEngine(account_balance=10000.0)
+    engine.in_cooldown = True
+    engine.daily_trades = 10**6
+
+    with capture_logs() as logs:
+        assert not engine.should_execute_trade(_trade_decision())
+
+    assert [entry["event"] for entry in logs] == ["Trade rejected: In cooldown period"]
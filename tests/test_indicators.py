@@ -0,0 +1,57 @@
+"""
+Test streaming indicators.
+"""
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.common.indicators import rsi_stream, sma_stream
+
+
+def test_sma_stream_matches_rolling_mean():
+    """Test the recurrence SMA equals a full rolling-window mean."""
+    close = np.cumsum(np.random.default_rng(0).normal(size=200)) + 100.0
+
+    result = sma_stream(close, 20)
+    expected = pd.Series(close).rolling(20).mean().to_numpy()
+
+    assert np.isnan(result[:19]).all()
+    np.testing.assert_allclose(result[19:], expected[19:], rtol=1e-9)
+
+
+def test_rsi_stream_bounds_and_warmup():
+    """Test RSI warm-up is NaN and values stay within 0..100."""
+    close = np.cumsum(np.random.default_rng(1).normal(size=200)) + 100.0
+
+    result = rsi_stream(close, 14)
+
+    assert np.isnan(result[:14]).all()
+    assert ((result[14:] >= 0) & (result[14:] <= 100)).all()
+
+
+def test_rsi_stream_monotonic_series():
+    """Test a strictly rising series has an RSI of 100."""
+    close = np.arange(1.0, 40.0)
+
+    assert rsi_stream(close, 14)[-1] == 100.0
+
+
+def test_nan_close_only_blanks_its_windows():
+    """Test a single NaN close does not wipe out the rest of the series."""
+    close = np.cumsum(np.random.default_rng(2).normal(size=60)) + 100.0
+    close[10] = np.nan
+
+    sma = sma_stream(close, 20)
+    expected = pd.Series(close).rolling(20).mean().to_numpy()
+    np.testing.assert_allclose(sma, expected, rtol=1e-9)
+    assert np.isfinite(sma[30:]).all()
+
+    rsi = rsi_stream(close, 14)
+    assert np.isnan(rsi[10:25]).all()
+    assert np.isfinite(rsi[25:]).all()
+    np.testing.assert_allclose(rsi[25:], rsi_stream(close[11:], 14)[14:], rtol=1e-9)
@@ -0,0 +1,162 @@
+"""
+Test Market Monitor data fetching.
+"""
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.market_monitor import MarketMonitor
+
+
+class FakeExchange:
+    """Sync ccxt stand-in that records concurrent fetches."""
+
+    def __init__(self, fail_on=None, delay: float = 0.05):
+        self.fail_on = fail_on
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def fetch_ohlcv(self, symbol, timeframe, limit, since=None):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if timeframe == self.fail_on:
+            raise RuntimeError("exchange unavailable")
+        return [[1704067200000 + i * 60000, 100.0, 101.0, 99.0, 100.0 + i, 10.0] for i in range(limit)]
+
+
+class GrowingExchange:
+    """Exchange stand-in whose candle history grows between calls."""
+
+    def __init__(self, candles: int):
+        self.candles = candles
+        self.calls = []
+
+    def fetch_ohlcv(self, symbol, timeframe, limit, since=None):
+        self.calls.append(since)
+        rows = [[i * 60000, 100.0, 101.0, 99.0, 100.0 + i, 10.0] for i in range(self.candles)]
+        if since is not None:
+            rows = [row for row in rows if row[0] >= since]
+        return rows[-limit:]
+
+
+def _make_monitor(exchange: FakeExchange) -> MarketMonitor:
+    monitor = MarketMonitor.__new__(MarketMonitor)
+    monitor.symbol = "BTC/USDT"
+    monitor.timeframes = ["1d", "4h", "15m"]
+    monitor.exchange = exchange
+    monitor.cache = {}
+    monitor._executor = ThreadPoolExecutor(max_workers=3)
+    monitor._local = threading.local()
+    monitor.created_exchanges = []
+
+    def _create_exchange():
+        monitor.created_exchanges.append(threading.get_ident())
+        return exchange
+
+    monitor._create_exchange = _create_exchange
+    return monitor
+
+
+def test_fetch_all_timeframes_runs_concurrently():
+    """Test all timeframes are fetched in parallel."""
+    exchange = FakeExchange()
+    monitor = _make_monitor(exchange)
+
+    result = monitor.fetch_all_timeframes(limit=30)
+
+    assert list(result) == ["1d", "4h", "15m"]
+    assert exchange.max_in_flight == 3
+    assert len(result["4h"].ohlcv) == 30
+    monitor.close()
+
+
+def test_each_worker_thread_uses_its_own_exchange():
+    """Test exchange instances are created once per pool thread and reused."""
+    monitor = _make_monitor(FakeExchange())
+
+    monitor.fetch_all_timeframes(limit=5)
+    monitor.fetch_all_timeframes(limit=5)
+
+    assert len(monitor.created_exchanges) == 3
+    assert len(set(monitor.created_exchanges)) == 3
+    monitor.close()
+
+
+def test_fetch_all_timeframes_skips_failed_timeframe():
+    """Test a failing timeframe does not drop the others."""
+    monitor = _make_monitor(FakeExchange(fail_on="4h"))
+
+    result = monitor.fetch_all_timeframes(limit=30)
+
+    assert set(result) == {"1d", "15m"}
+    monitor.close()
+
+
+def test_fetch_ohlcv_only_downloads_new_candles():
+    """Test repeat fetches request candles since the last bar and merge them."""
+    exchange = GrowingExchange(candles=50)
+    monitor = _make_monitor(exchange)
+
+    monitor.fetch_ohlcv("1d", limit=30)
+    exchange.candles = 53
+    data = monitor.fetch_ohlcv("1d", limit=30)
+
+    assert exchange.calls == [None, 49 * 60000]
+    assert len(data.ohlcv) == 30
+    assert data.ohlcv[-1, 0] == 52 * 60000
+    assert (data.ohlcv[1:, 0] - data.ohlcv[:-1, 0] == 60000).all()
+    monitor.close()
+
+
+def test_fetch_ohlcv_falls_back_to_full_download_after_a_gap():
+    """Test a full page of new candles triggers a full download."""
+    exchange = GrowingExchange(candles=50)
+    monitor = _make_monitor(exchange)
+
+    monitor.fetch_ohlcv("1d", limit=10)
+    exchange.candles = 80
+    data = monitor.fetch_ohlcv("1d", limit=10)
+
+    assert exchange.calls == [None, 49 * 60000, None]
+    assert data.ohlcv[-1, 0] == 79 * 60000
+    monitor.close()
+
+
+def test_cached_data_is_built_from_the_last_fetch():
+    """Test get_cached_data wraps the cached candle array in a DataFrame."""
+    monitor = _make_monitor(GrowingExchange(candles=50))
+
+    assert monitor.get_cached_data("4h") is None
+    data = monitor.fetch_ohlcv("4h", limit=30)
+    frame = monitor.get_cached_data("4h")
+
+    assert list(frame.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+    assert (frame['close'].to_numpy() == data.ohlcv[:, 4]).all()
+    monitor.close()
+
+
+def test_last_bar_closed_flag():
+    """Test MarketData.is_closed reflects whether the newest candle's period has ended."""
+    now_ms = time.time() * 1000
+    closed = np.array([[now_ms - 2 * 60 * 60_000, 1.0, 1.0, 1.0, 1.0, 1.0]])
+    forming = np.array([[now_ms - 60_000, 1.0, 1.0, 1.0, 1.0, 1.0]])
+
+    assert MarketMonitor._is_last_bar_closed(closed, "1h")
+    assert not MarketMonitor._is_last_bar_closed(forming, "1h")
+    assert MarketMonitor._is_last_bar_closed(np.empty((0, 6)), "1h")
+    with pytest.raises(ValueError):
+        MarketMonitor._is_last_bar_closed(closed, "3w")
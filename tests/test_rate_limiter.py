@@ -0,0 +1,64 @@
+"""
+Test the async RPM/TPM rate limiter.
+"""
+import asyncio
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai_decision.rate_limiter import AsyncRateLimiter
+
+
+def _make_limiter(rpm: int, tpm: int):
+    """Build a limiter on a fake clock whose sleep just advances time."""
+    limiter = AsyncRateLimiter(rpm, tpm)
+    now = [0.0]
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter._clock = lambda: now[0]
+    limiter._sleep = fake_sleep
+    limiter._updated = 0.0
+    return limiter, sleeps
+
+
+def test_requests_within_budget_do_not_wait():
+    """Test a full bucket serves a burst without sleeping."""
+    limiter, sleeps = _make_limiter(rpm=60, tpm=0)
+
+    async def burst():
+        for _ in range(60):
+            await limiter.acquire(100)
+
+    asyncio.run(burst())
+    assert sleeps == []
+
+
+def test_request_budget_paces_calls():
+    """Test an empty request bucket waits for the refill (1 request/s at 60 RPM)."""
+    limiter, sleeps = _make_limiter(rpm=60, tpm=0)
+
+    async def burst():
+        for _ in range(62):
+            await limiter.acquire(100)
+
+    asyncio.run(burst())
+    assert sleeps == [1.0, 1.0]
+
+
+def test_token_budget_paces_calls_and_caps_oversized_requests():
+    """Test the token bucket limits calls and oversized requests still go through."""
+    limiter, sleeps = _make_limiter(rpm=0, tpm=6000)
+
+    async def calls():
+        await limiter.acquire(4000)
+        await limiter.acquire(4000)
+        await limiter.acquire(10_000)
+
+    asyncio.run(calls())
+    assert sleeps == [20.0, 60.0]
@@ -0,0 +1,79 @@
+"""
+Test Rule Engine helpers.
+"""
+import sys
+import os
+from datetime import datetime
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.common.models import MarketData, Timeframe
+from src.rule_engine.rule_engine import RuleEngine
+
+
+def test_detect_setups_builds_each_frame_once():
+    """Test the 4h frame is shared by the bounce and rejection checks."""
+    engine = RuleEngine()
+    built = []
+    to_df = engine._to_df
+    engine._to_df = lambda data: built.append(data.timeframe) or to_df(data)
+
+    now_ms = 1704067200000
+    candles = [[now_ms + k * 4 * 3600_000, 100.0, 101.0, 99.0, 100.0, 1.0] for k in range(150)]
+    market_data = {
+        "4h": MarketData(
+            symbol="BTC/USDT",
+            timeframe=Timeframe.FOUR_HOURS,
+            timestamp=datetime(2024, 1, 1),
+            ohlcv=candles,
+        )
+    }
+
+    assert engine.detect_setups(market_data) == []
+    assert built == [Timeframe.FOUR_HOURS]
+
+
+def test_level_is_recomputed_only_on_new_bar():
+    """Test the cached level is reused until a new candle arrives."""
+    engine = RuleEngine()
+    calls = []
+    find_level = engine._find_level
+    engine._find_level = lambda **kwargs: calls.append(kwargs["kind"]) or find_level(**kwargs)
+
+    now_ms = 1704067200000
+    candles = np.array(
+        [[now_ms + k * 4 * 3600_000, 100.0, 101.0 + k % 5, 99.0 - k % 3, 100.0, 1.0] for k in range(150)]
+    )
+    data = MarketData(symbol="BTC/USDT", timeframe=Timeframe.FOUR_HOURS, timestamp=datetime(2024, 1, 1), ohlcv=candles)
+    df = engine._to_df(data)
+
+    first = engine._cached_level("BTC/USDT", Timeframe.FOUR_HOURS, df, "support", 2.0, 120)
+    assert engine._cached_level("BTC/USDT", Timeframe.FOUR_HOURS, df, "support", 2.0, 120) is first
+    assert calls == ["support"]
+
+    next_bar = np.vstack([candles, [now_ms + 150 * 4 * 3600_000, 100.0, 101.0, 99.0, 100.0, 1.0]])
+    data = MarketData(symbol="BTC/USDT", timeframe=Timeframe.FOUR_HOURS, timestamp=datetime(2024, 1, 1), ohlcv=next_bar)
+    engine._cached_level("BTC/USDT", Timeframe.FOUR_HOURS, engine._to_df(data), "support", 2.0, 120)
+    assert calls == ["support", "support"]
+
+
+def test_fifteen_minute_frame_skipped_without_breakout():
+    """Test the 15m frame is never built when the daily chart has no breakout."""
+    engine = RuleEngine()
+    built = []
+    to_df = engine._to_df
+    engine._to_df = lambda data: built.append(data.timeframe) or to_df(data)
+
+    now_ms = 1704067200000
+    market_data = {}
+    for timeframe, step_ms, bars in (("1d", 86400_000, 150), ("15m", 900_000, 400)):
+        candles = [[now_ms + k * step_ms, 100.0, 103.0, 97.0, 100.0, 1.0] for k in range(bars)]
+        market_data[timeframe] = MarketData(
+            symbol="BTC/USDT", timeframe=timeframe, timestamp=datetime(2024, 1, 1), ohlcv=candles
+        )
+
+    assert engine.detect_setups(market_data) == []
+    assert built == [Timeframe.ONE_DAY]
@@ -0,0 +1,125 @@
+"""
+Test Rule Engine numeric kernels against the reference pandas/numpy logic.
+"""
+import sys
+import os
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.rule_engine._kernels import best_level, pivot_points, recent_breakout_close, retest_reclaim
+
+
+def _reference_pivots(arr, left, right, mode):
+    n = len(arr)
+    piv = np.zeros(n, dtype=bool)
+    for i in range(left, n - right):
+        window = arr[i - left : i + right + 1]
+        if not np.all(np.isfinite(window)):
+            continue
+        m = window.max() if mode == "high" else window.min()
+        if arr[i] == m and np.sum(window == m) == 1:
+            piv[i] = True
+    return piv
+
+
+def _reference_breakout(high, low, close, threshold, start, close_pos_min):
+    for i in range(len(close) - 1, start - 1, -1):
+        if close[i] > threshold and close[i - 1] <= threshold:
+            rng = max(high[i] - low[i], 1e-12)
+            if (close[i] - low[i]) / rng >= close_pos_min:
+                return i
+    return -1
+
+
+def _reference_level(piv_prices, piv_idx, tol, min_touches):
+    best = None
+    for j in range(len(piv_prices)):
+        mask = np.abs(piv_prices - piv_prices[j]) <= tol
+        touches = int(mask.sum())
+        if touches < min_touches:
+            continue
+        score = touches * 10_000 + int(np.max(piv_idx[mask]))
+        if best is None or score > best[0]:
+            best = (score, float(np.median(piv_prices[mask])), touches, int(np.max(piv_idx[mask])))
+    return (0.0, 0, -1) if best is None else best[1:]
+
+
+def _reference_retest(o, h, l, c, start, zone_low, zone_high, max_age, lookahead, close_pos_min):
+    touched = np.flatnonzero((l[start:] <= zone_high) & (h[start:] >= zone_low))
+    if len(touched) == 0:
+        return -1, -1
+    touch = start + int(touched[-1])
+    if len(c) - 1 - touch > max_age:
+        return touch, -1
+    for k in range(touch + 1, min(len(c), touch + 1 + lookahead)):
+        close_pos = (c[k] - l[k]) / max(h[k] - l[k], 1e-12)
+        if c[k] > zone_high and c[k] > o[k] and close_pos >= close_pos_min:
+            return touch, k
+    return touch, -1
+
+
+def test_pivot_points_match_reference():
+    """Test pivots match the window max/min definition, including ties and NaN."""
+    rng = np.random.default_rng(3)
+    for _ in range(500):
+        # Small integer values force ties; sprinkle NaN into some series
+        values = rng.integers(0, 8, size=rng.integers(1, 40)).astype(np.float64)
+        if rng.random() < 0.3:
+            values[rng.integers(0, len(values))] = np.nan
+        left, right = int(rng.integers(1, 5)), int(rng.integers(1, 5))
+
+        for mode in ("high", "low"):
+            expected = _reference_pivots(values, left, right, mode)
+            result = pivot_points(values, left, right, mode == "high")
+            np.testing.assert_array_equal(result, expected)
+
+
+def test_recent_breakout_close_matches_reference():
+    """Test the breakout kernel finds the same bar as the row-wise loop."""
+    rng = np.random.default_rng(4)
+    for _ in range(500):
+        n = int(rng.integers(2, 60))
+        close = rng.normal(100.0, 2.0, size=n)
+        high = close + rng.random(n) * 2.0
+        low = close - rng.random(n) * 2.0
+        threshold = float(rng.normal(100.0, 1.0))
+        start = int(rng.integers(1, n))
+        close_pos_min = float(rng.random())
+
+        expected = _reference_breakout(high, low, close, threshold, start, close_pos_min)
+        assert recent_breakout_close(high, low, close, threshold, start, close_pos_min) == expected
+
+
+def test_best_level_matches_reference():
+    """Test the level kernel picks the same level, touches and last touch."""
+    rng = np.random.default_rng(5)
+    for _ in range(500):
+        n = int(rng.integers(0, 30))
+        piv_prices = rng.normal(100.0, 1.0, size=n).round(1)
+        piv_idx = np.sort(rng.choice(200, size=n, replace=False)).astype(np.int64)
+        tol = float(rng.uniform(0.0, 1.0))
+        min_touches = int(rng.integers(1, 4))
+
+        expected = _reference_level(piv_prices, piv_idx, tol, min_touches)
+        assert best_level(piv_prices, piv_idx, tol, min_touches) == expected
+
+
+def test_retest_reclaim_matches_reference():
+    """Test the fused retest/reclaim scan finds the same touch and reclaim bars."""
+    rng = np.random.default_rng(6)
+    for _ in range(500):
+        n = int(rng.integers(1, 80))
+        open_ = rng.uniform(99, 101, n)
+        close = rng.uniform(99, 101, n)
+        high = np.maximum(open_, close) + rng.uniform(0, 1, n)
+        low = np.minimum(open_, close) - rng.uniform(0, 1, n)
+        start = int(rng.integers(0, n))
+        zone_low = float(rng.uniform(98, 101))
+        zone_high = zone_low + float(rng.uniform(0, 1))
+        max_age, lookahead = int(rng.integers(0, 40)), int(rng.integers(0, 10))
+
+        args = (open_, high, low, close, start, zone_low, zone_high, max_age, lookahead, 0.6)
+        assert retest_reclaim(*args) == _reference_retest(*args)
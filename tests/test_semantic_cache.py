@@ -0,0 +1,85 @@
+"""
+Test the semantic decision cache.
+"""
+import sys
+import os
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai_decision.semantic_cache import SemanticDecisionCache
+from src.common.models import AIConfidence, AIDecision, AIDecisionOutput
+
+
+def _ai_input(closes, support: float, pattern: str = "support_bounce", indicators=None) -> dict:
+    candles = np.zeros((len(closes), 5), dtype=np.int64)
+    candles[:, 3] = np.asarray(closes) - 50000
+    return {
+        "setup": {
+            "symbol": "BTC/USDT",
+            "pattern_type": pattern,
+            "context_data": {"level": {"support": support, "touches": 3}},
+        },
+        "current_price": 50500.0,
+        "market_data": {"4h": {"base": 50000.0, "tick": 1.0, "vol_tick": 1.0, "candles": candles}},
+        "indicators": indicators or {},
+    }
+
+
+def _decision(decision: AIDecision) -> AIDecisionOutput:
+    return AIDecisionOutput(decision=decision, confidence=AIConfidence.LOW, reason_code="CHOPPY")
+
+
+def test_near_identical_input_reuses_decision():
+    """Test a slightly different window hits and a different pattern does not."""
+    cache = SemanticDecisionCache(threshold=0.97)
+    closes = np.linspace(49000, 50400, 20)
+    cache.store(_ai_input(closes, 49500.0), _decision(AIDecision.WAIT))
+
+    hit = cache.lookup(_ai_input(closes + 3, 49500.0))
+    assert hit is not None and hit.decision == AIDecision.WAIT
+    assert cache.lookup(_ai_input(closes, 49500.0, pattern="breakout_retest")) is None
+    assert cache.lookup(_ai_input(closes[::-1], 49500.0)) is None
+
+
+def test_trade_decisions_are_not_reused():
+    """Test TRADE decisions, which carry prices, are never stored."""
+    cache = SemanticDecisionCache(threshold=0.97)
+    closes = np.linspace(49000, 50400, 20)
+    cache.store(_ai_input(closes, 49500.0), _decision(AIDecision.TRADE))
+
+    assert cache.lookup(_ai_input(closes, 49500.0)) is None
+
+
+def test_scaled_window_does_not_hit():
+    """Test a window with the same shape but a much larger move is not reused."""
+    cache = SemanticDecisionCache(threshold=0.97)
+    closes = np.linspace(50400, 50500, 20)
+    support = 50450.0
+    cache.store(_ai_input(closes, support), _decision(AIDecision.WAIT))
+
+    # Every return relative to the current price is 10x larger: same unit vector
+    scaled = 50500 + (closes - 50500) * 10
+    scaled_support = 50500 + (support - 50500) * 10
+    assert cache.lookup(_ai_input(closes, support)) is not None
+    assert cache.lookup(_ai_input(scaled, scaled_support)) is None
+
+
+def test_indicators_must_match():
+    """Test inputs differing only in SMA-20 or RSI-14 do not hit."""
+    cache = SemanticDecisionCache(threshold=0.97)
+    closes = np.linspace(49000, 50400, 20)
+
+    def indicators(sma_last: float, rsi_last: float) -> dict:
+        sma = np.linspace(49500, sma_last, 20)
+        rsi = np.full(20, 50.0)
+        rsi[-1] = rsi_last
+        return {"4h": {"sma_20": sma, "rsi_14": rsi}}
+
+    cache.store(_ai_input(closes, 49500.0, indicators=indicators(49800.0, 41.0)), _decision(AIDecision.WAIT))
+
+    assert cache.lookup(_ai_input(closes, 49500.0, indicators=indicators(49800.0, 42.0))) is not None
+    assert cache.lookup(_ai_input(closes, 49500.0, indicators=indicators(49800.0, 62.0))) is None
+    assert cache.lookup(_ai_input(closes, 49500.0, indicators=indicators(52000.0, 41.0))) is None
@@ -0,0 +1,75 @@
+"""
+Test Trading System cycle orchestration.
+"""
+import sys
+import os
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.common.models import AIConfidence, AIDecision, AIDecisionOutput
+from src.trading_system import TradingSystem
+
+
+def _decision(decision: AIDecision) -> AIDecisionOutput:
+    return AIDecisionOutput(decision=decision, confidence=AIConfidence.MID, reason_code="TEST")
+
+
+def _make_system(decisions_by_event: dict) -> TradingSystem:
+    system = TradingSystem.__new__(TradingSystem)
+    system.pending_setups = {}
+    system.batches = []
+    system.executed = []
+    system.market_monitor = SimpleNamespace(get_latest_price=lambda: 100.0)
+
+    def validate_setups(setups, market_data, current_price):
+        system.batches.append([s.event_id for s in setups])
+        return [decisions_by_event[s.event_id] for s in setups]
+
+    system.ai_decision_engine = SimpleNamespace(validate_setups=validate_setups)
+    system._execute_trade = lambda setup, ai_decision, price: system.executed.append(setup.event_id)
+    return system
+
+
+def _setup(event_id: str):
+    return SimpleNamespace(event_id=event_id, pattern_type="support_bounce")
+
+
+def _pending(event_id: str, recheck_count: int = 0) -> dict:
+    return {"setup": _setup(event_id), "ai_decision": None, "recheck_count": recheck_count}
+
+
+def test_new_and_pending_setups_share_one_batch_in_order():
+    """Test one AI batch covers new then pending setups and each gets its own decision."""
+    system = _make_system({
+        "new-trade": _decision(AIDecision.TRADE),
+        "new-wait": _decision(AIDecision.WAIT),
+        "old-trade": _decision(AIDecision.TRADE),
+        "old-reject": _decision(AIDecision.NO_TRADE),
+        "old-wait": _decision(AIDecision.WAIT),
+    })
+    system.pending_setups = {
+        "old-trade": _pending("old-trade"),
+        "old-reject": _pending("old-reject"),
+        "old-wait": _pending("old-wait", recheck_count=2),
+    }
+
+    system._process_setups([_setup("new-trade"), _setup("new-wait")], {})
+
+    assert system.batches == [["new-trade", "new-wait", "old-trade", "old-reject", "old-wait"]]
+    assert system.executed == ["new-trade", "old-trade"]
+    assert set(system.pending_setups) == {"new-wait", "old-wait"}
+    assert system.pending_setups["new-wait"]["recheck_count"] == 0
+    assert system.pending_setups["old-wait"]["recheck_count"] == 3
+
+
+def test_expired_pending_setups_are_dropped_before_validation():
+    """Test setups at the re-check limit are removed without an AI call."""
+    system = _make_system({})
+    system.pending_setups = {"stale": _pending("stale", recheck_count=5)}
+
+    system._process_setups([], {})
+
+    assert system.batches == []
+    assert system.pending_setups == {}